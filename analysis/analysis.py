@@ -1,16 +1,18 @@
 """
 A module for analysis in the analysis package.
 """
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
-from matplotlib import pyplot as plt
-from scipy.sparse import csr_matrix
-from sklearn.cluster import KMeans
-from sklearn.decomposition import LatentDirichletAllocation, TruncatedSVD
-from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
-from sklearn.metrics import silhouette_score
 
 from core.config import settings
+from core.decorators import profile
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+
+    from analysis.model_selection import SweepResult
 
 
 def analyze_dataframe(dataframe: pd.DataFrame) -> None:
@@ -34,12 +36,17 @@ def analyze_dataframe(dataframe: pd.DataFrame) -> None:
         print(non_numeric_df[column].value_counts(normalize=True) * 100)
 
 
+@profile
 def latent_semantic_analysis(
-    dataframe: pd.DataFrame, column: str, stop_words: list[str]
+    dataframe: pd.DataFrame,
+    column: str,
+    stop_words: list[str],
+    variance_threshold: float = settings.LSA_VARIANCE_THRESHOLD,
 ) -> np.ndarray:
     """
     Perform latent semantic analysis on a given dataframe column using
-     TruncatedSVD.
+     TruncatedSVD, keeping the components that reach the explained
+      variance threshold.
     :param dataframe: The input DataFrame.
     :type dataframe: pd.DataFrame
     :param column: The name of the column containing text data.
@@ -47,27 +54,27 @@ def latent_semantic_analysis(
     :param stop_words: A list of stop words to be used in
      TfidfVectorizer
     :type stop_words: list[str]
+    :param variance_threshold: Cumulative explained variance ratio the
+     kept components must reach
+    :type variance_threshold: float
     :return: The reduced matrix after LSA.
     :rtype: np.ndarray
     """
-    tfidf_matrix: TfidfVectorizer = TfidfVectorizer(stop_words=stop_words)
-    weighted_tfidf_matrix = tfidf_matrix.fit_transform(dataframe[column])
-    svd: TruncatedSVD = TruncatedSVD(n_components=100)
-    svd.fit(weighted_tfidf_matrix)
-    var: np.ndarray = svd.explained_variance_ratio_
-    plt.plot(var)
-    plt.xlabel("Number of components")
-    plt.ylabel("Explained variance ratio")
-    plt.show()
-    cumulative_explained_variance_ratio = np.cumsum(var)
-    n_components = np.argmax(cumulative_explained_variance_ratio >= 0.9) + 1
-    print(n_components)
-    reduced_matrix: np.ndarray = svd.fit_transform(weighted_tfidf_matrix)
+    from analysis.lsa import LSAEngine
+
+    engine: LSAEngine = LSAEngine(
+        variance_threshold=variance_threshold, stop_words=stop_words
+    )
+    reduced_matrix: np.ndarray = engine.fit_transform(dataframe[column])
     return reduced_matrix
 
 
 def latent_dirichlet_allocation(
-    dataframe: pd.DataFrame, column: str, stop_words: list[str]
+    dataframe: pd.DataFrame,
+    column: str,
+    stop_words: list[str],
+    online: bool = False,
+    chunk_size: int = settings.CHUNK_SIZE,
 ) -> np.ndarray:
     """
     Applies Latent Dirichlet Allocation (LDA) to the text in the
@@ -78,14 +85,33 @@ def latent_dirichlet_allocation(
     :type column: str
     :param stop_words: A list of stop words to be removed from the text
     :type stop_words: list[str]
+    :param online: Whether to learn the topics online from chunks of the
+     column with a hashed vocabulary instead of a batch fit
+    :type online: bool
+    :param chunk_size: Number of documents per chunk in online mode
+    :type chunk_size: int
     :return: A matrix of shape (n_samples, n_components) containing the
      topic weights for each sample
     :rtype: np.ndarray
     """
+    if online:
+        from analysis.topics import OnlineLDA
+
+        lda: OnlineLDA = OnlineLDA(
+            stop_words=stop_words, total_samples=len(dataframe)
+        )
+        lda.fit_chunks(
+            dataframe[column].iloc[start : start + chunk_size]
+            for start in range(0, len(dataframe), chunk_size)
+        )
+        return lda.transform(dataframe[column])
+    from sklearn.decomposition import LatentDirichletAllocation
+    from sklearn.feature_extraction.text import CountVectorizer
+
     token_counts_matrix: CountVectorizer = CountVectorizer(
         stop_words=stop_words, max_df=0.95, min_df=2
     )
-    doc_term_matrix: csr_matrix = token_counts_matrix.fit_transform(
+    doc_term_matrix: "csr_matrix" = token_counts_matrix.fit_transform(
         dataframe[column]
     )
     lda_classifier: LatentDirichletAllocation = LatentDirichletAllocation(
@@ -97,40 +123,51 @@ def latent_dirichlet_allocation(
     return transformed_matrix
 
 
-def silhouette_scores(matrix: np.ndarray, n_clusters_range: range) -> None:
+def silhouette_scores(
+    matrix: np.ndarray, n_clusters_range: range
+) -> "SweepResult":
     """
     Computes the average silhouette score for a range of cluster
-     numbers
+     numbers, fitting each number of clusters once in parallel
     :param matrix: The input matrix to cluster.
     :type matrix: np.ndarray
     :param n_clusters_range: The range of cluster numbers to try
     :type n_clusters_range: range
-    :return: None
-    :rtype: NoneType
+    :return: The inertia and silhouette score of each number of clusters
+    :rtype: SweepResult
     """
-    for n_clusters in n_clusters_range:
-        kmeans: KMeans = KMeans(n_clusters=n_clusters, n_init=10)
-        labels: np.ndarray = kmeans.fit_predict(matrix)
-        silhouette_avg: float = silhouette_score(matrix, labels)
-        print(
-            "For n_clusters =",
-            n_clusters,
-            "The average silhouette_score is :",
-            silhouette_avg,
-        )
+    from analysis.model_selection import sweep_clusters
+
+    return sweep_clusters(matrix, n_clusters_range)
 
 
-def kmeans_clustering(x_transformed: np.ndarray, n_clusters: int) -> np.ndarray:
+def kmeans_clustering(
+    x_transformed: np.ndarray, n_clusters: int, mini_batch: bool = False
+) -> np.ndarray:
     """
     Applies K-means clustering to the transformed data and returns the
      predicted cluster labels
-    :param x_transformed: The transformed data to cluster
+    :param x_transformed: The transformed data to cluster, possibly
+     memory-mapped with analysis.clustering.open_matrix
     :type x_transformed: np.ndarray
     :param n_clusters: The number of clusters to use in K-means
     :type n_clusters: int
+    :param mini_batch: Whether to train mini-batch K-means from chunks
+     of the data instead of full-batch K-means in memory
+    :type mini_batch: bool
     :return: The predicted cluster labels.
     :rtype: np.ndarray
     """
+    if mini_batch:
+        from analysis.clustering import StreamingKMeans
+
+        return (
+            StreamingKMeans(n_clusters)
+            .fit(x_transformed)
+            .predict(x_transformed)
+        )
+    from sklearn.cluster import KMeans
+
     k_means: KMeans = KMeans(n_clusters=n_clusters, n_init=10)
     y_pred: np.ndarray = k_means.fit_predict(x_transformed)
     return y_pred
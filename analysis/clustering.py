@@ -0,0 +1,217 @@
+"""
+A module for out-of-core clustering in the analysis package.
+"""
+import logging
+import os
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from core.config import settings
+from core.file_manager import DataType
+from core.persistence_manager import PersistenceManager
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MatrixSource = Union[np.ndarray, str, Path]
+
+
+def save_matrix(
+    matrix: np.ndarray,
+    filename: str = "lsa_matrix.npy",
+    data_type: Optional[DataType] = DataType.PROCESSED,
+) -> str:
+    """
+    Save a matrix, e.g. the LSA reduced matrix, as a .npy file that can
+     be memory-mapped later
+    :param matrix: The matrix to save
+    :type matrix: np.ndarray
+    :param filename: Name of the file
+    :type filename: str
+    :param data_type: Path where the matrix will be saved
+    :type data_type: Optional[DataType]
+    :return: The path of the saved file
+    :rtype: str
+    """
+    filepath: str = (
+        os.path.join(data_type, filename) if data_type else str(filename)
+    )
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+    np.save(filepath, matrix)
+    return filepath
+
+
+def open_matrix(
+    source: MatrixSource, data_type: Optional[DataType] = None
+) -> np.ndarray:
+    """
+    Get a matrix either given in memory or memory-mapped read-only from
+     a .npy file, so only the rows being used are loaded
+    :param source: The matrix or the name of its .npy file
+    :type source: MatrixSource
+    :param data_type: Path where the matrix was saved
+    :type data_type: Optional[DataType]
+    :return: The matrix
+    :rtype: np.ndarray
+    """
+    if isinstance(source, np.ndarray):
+        return source
+    if data_type:
+        source = os.path.join(data_type, source)
+    return np.load(source, mmap_mode="r")
+
+
+def iter_chunks(
+    matrix: np.ndarray, chunk_size: int = settings.KMEANS_CHUNK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    Yield consecutive row chunks of a matrix loaded in memory
+    :param matrix: The matrix, possibly memory-mapped
+    :type matrix: np.ndarray
+    :param chunk_size: Maximum number of rows per chunk
+    :type chunk_size: int
+    :return: Iterator of row chunks
+    :rtype: Iterator[np.ndarray]
+    """
+    for start in range(0, matrix.shape[0], chunk_size):
+        yield np.asarray(matrix[start : start + chunk_size])
+
+
+class StreamingKMeans:
+    """
+    Mini-batch K-means trained from row chunks of a matrix that may not
+     fit in memory, updatable with new data and persisted for predict.
+    """
+
+    def __init__(
+        self,
+        n_clusters: int,
+        chunk_size: int = settings.KMEANS_CHUNK_SIZE,
+        random_state: Optional[int] = 0,
+    ):
+        """
+        Initialize the clustering.
+        :param n_clusters: The number of clusters
+        :type n_clusters: int
+        :param chunk_size: Number of rows loaded and used per update
+        :type chunk_size: int
+        :param random_state: Seed of the clustering
+        :type random_state: Optional[int]
+        """
+        from sklearn.cluster import MiniBatchKMeans
+
+        self.chunk_size: int = max(chunk_size, n_clusters)
+        self.model: MiniBatchKMeans = MiniBatchKMeans(
+            n_clusters=n_clusters,
+            batch_size=self.chunk_size,
+            random_state=random_state,
+            n_init="auto",
+        )
+
+    def partial_fit(
+        self, source: MatrixSource, data_type: Optional[DataType] = None
+    ) -> "StreamingKMeans":
+        """
+        Update the clusters with one pass over new data, e.g. the reduced
+         matrix of the documents of the day
+        :param source: The matrix or the name of its .npy file
+        :type source: MatrixSource
+        :param data_type: Path where the matrix was saved
+        :type data_type: Optional[DataType]
+        :return: The updated clustering
+        :rtype: StreamingKMeans
+        """
+        for chunk in iter_chunks(
+            open_matrix(source, data_type), self.chunk_size
+        ):
+            # The first update needs at least one row per cluster
+            if (
+                not hasattr(self.model, "cluster_centers_")
+                and chunk.shape[0] < self.model.n_clusters
+            ):
+                logger.warning(
+                    "Skipping %s rows, fewer than the %s clusters",
+                    chunk.shape[0],
+                    self.model.n_clusters,
+                )
+                continue
+            self.model.partial_fit(chunk)
+        return self
+
+    def fit(
+        self,
+        source: MatrixSource,
+        data_type: Optional[DataType] = None,
+        epochs: int = settings.KMEANS_EPOCHS,
+    ) -> "StreamingKMeans":
+        """
+        Train the clusters with several passes over the data
+        :param source: The matrix or the name of its .npy file
+        :type source: MatrixSource
+        :param data_type: Path where the matrix was saved
+        :type data_type: Optional[DataType]
+        :param epochs: Number of passes over the data
+        :type epochs: int
+        :return: The trained clustering
+        :rtype: StreamingKMeans
+        """
+        for _ in range(epochs):
+            self.partial_fit(source, data_type)
+        return self
+
+    def predict(
+        self, source: MatrixSource, data_type: Optional[DataType] = None
+    ) -> np.ndarray:
+        """
+        Assign the rows of a matrix to the nearest cluster chunk by chunk
+        :param source: The matrix or the name of its .npy file
+        :type source: MatrixSource
+        :param data_type: Path where the matrix was saved
+        :type data_type: Optional[DataType]
+        :return: The cluster label of each row
+        :rtype: np.ndarray
+        """
+        matrix: np.ndarray = open_matrix(source, data_type)
+        labels: np.ndarray = np.empty(matrix.shape[0], dtype=np.int32)
+        for start, chunk in zip(
+            range(0, matrix.shape[0], self.chunk_size),
+            iter_chunks(matrix, self.chunk_size),
+        ):
+            labels[start : start + chunk.shape[0]] = self.model.predict(chunk)
+        return labels
+
+    def save(
+        self,
+        filename: str = "kmeans.joblib",
+        data_type: Optional[DataType] = DataType.PROCESSED,
+    ) -> bool:
+        """
+        Save the trained clustering
+        :param filename: Name of the file
+        :type filename: str
+        :param data_type: Path where the clustering will be saved
+        :type data_type: Optional[DataType]
+        :return: True if the file was created; otherwise false.
+        :rtype: bool
+        """
+        return PersistenceManager.save_object(self, data_type, filename)
+
+    @staticmethod
+    def load(
+        filename: str = "kmeans.joblib",
+        data_type: Optional[DataType] = DataType.PROCESSED,
+    ) -> "StreamingKMeans":
+        """
+        Load a clustering saved with save
+        :param filename: Name of the file
+        :type filename: str
+        :param data_type: Path where the clustering was saved
+        :type data_type: Optional[DataType]
+        :return: The trained clustering
+        :rtype: StreamingKMeans
+        """
+        clustering: StreamingKMeans = PersistenceManager.load_object(
+            filename, data_type
+        )
+        return clustering
@@ -0,0 +1,128 @@
+"""
+A module for classification evaluation in the analysis package.
+"""
+import logging
+from typing import Any, Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from core.config import settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ConfusionPair(BaseModel):
+    """
+    A pair of classes confused by a classifier
+    """
+
+    true_label: str
+    predicted_label: str
+    count: float
+    rate: float
+
+
+def _to_labels(predictions: Any) -> Any:
+    """
+    Get class labels from labels or scores, either a tensor or an array.
+    Scores of shape (n_samples, n_classes), e.g. the logits of
+     BertAgent.predict_batch, are reduced to their highest class
+    :param predictions: Labels or scores
+    :type predictions: Any
+    :return: The labels, still a tensor if a tensor was given
+    :rtype: Any
+    """
+    if not hasattr(predictions, "detach"):
+        predictions = np.asarray(predictions)
+    if predictions.ndim == 2:
+        return predictions.argmax(-1)
+    return predictions.reshape(-1)
+
+
+def confusion_matrix_from_predictions(
+    y_true: Any, y_pred: Any, n_classes: Optional[int] = None
+) -> np.ndarray:
+    """
+    Count the confusion matrix of predictions with a single bincount,
+     computed on the device of the tensors when tensors are given
+    :param y_true: The true labels, a tensor or an array
+    :type y_true: Any
+    :param y_pred: The predicted labels or scores, a tensor or an array
+    :type y_pred: Any
+    :param n_classes: Number of classes. Inferred from the labels if None
+    :type n_classes: Optional[int]
+    :return: Matrix whose rows are the true and columns the predicted
+     classes
+    :rtype: np.ndarray
+    """
+    y_true = _to_labels(y_true)
+    y_pred = _to_labels(y_pred)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(
+            f"{y_true.shape[0]} true labels for {y_pred.shape[0]} predictions"
+        )
+    if n_classes is None:
+        n_classes = (
+            int(max(y_true.max(), y_pred.max())) + 1 if len(y_true) else 0
+        )
+    if hasattr(y_true, "detach") or hasattr(y_pred, "detach"):
+        tensor: Any = y_true if hasattr(y_true, "detach") else y_pred
+        y_true, y_pred = (
+            (labels if hasattr(labels, "detach") else tensor.new_tensor(labels))
+            .to(tensor.device)
+            .long()
+            for labels in (y_true, y_pred)
+        )
+        counts: np.ndarray = (
+            (y_true * n_classes + y_pred)
+            .bincount(minlength=n_classes * n_classes)
+            .cpu()
+            .numpy()
+        )
+    else:
+        counts = np.bincount(
+            y_true.astype(np.int64) * n_classes + y_pred.astype(np.int64),
+            minlength=n_classes * n_classes,
+        )
+    return counts.reshape(n_classes, n_classes)
+
+
+def top_confusions(
+    conf_matrix: np.ndarray,
+    classes: list[str],
+    k: int = settings.CONFUSION_TOP_K,
+) -> list[ConfusionPair]:
+    """
+    Get the k most frequent errors of a confusion matrix
+    :param conf_matrix: Matrix whose rows are the true and columns the
+     predicted classes
+    :type conf_matrix: np.ndarray
+    :param classes: List of class names
+    :type classes: list[str]
+    :param k: Number of pairs to keep
+    :type k: int
+    :return: The confused pairs, most frequent first
+    :rtype: list[ConfusionPair]
+    """
+    errors: np.ndarray = np.array(conf_matrix, dtype=float)
+    np.fill_diagonal(errors, 0)
+    flat_errors: np.ndarray = errors.ravel()
+    k = min(k, int(np.count_nonzero(flat_errors)))
+    if not k:
+        return []
+    indices: np.ndarray = np.argpartition(flat_errors, -k)[-k:]
+    indices = indices[np.argsort(flat_errors[indices])[::-1]]
+    support: np.ndarray = np.asarray(conf_matrix).sum(axis=1)
+    pairs: list[ConfusionPair] = []
+    for true_index, pred_index in zip(*np.unravel_index(indices, errors.shape)):
+        count: float = float(errors[true_index, pred_index])
+        pairs.append(
+            ConfusionPair(
+                true_label=classes[true_index],
+                predicted_label=classes[pred_index],
+                count=count,
+                rate=count / support[true_index],
+            )
+        )
+    return pairs
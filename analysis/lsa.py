@@ -0,0 +1,267 @@
+"""
+A module for latent semantic analysis in the analysis package.
+"""
+import logging
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+import numpy as np
+
+from core.config import settings
+from core.file_manager import DataType
+from core.persistence_manager import PersistenceManager
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+ALGORITHMS: tuple[str, ...] = ("randomized", "arpack", "incremental")
+
+
+class LSAEngine:
+    """
+    Latent semantic analysis fitted once, keeping the smallest number
+     of components that reaches the explained variance threshold.
+    The randomized and arpack algorithms fit a TF-IDF vocabulary and a
+     truncated SVD in memory. The incremental algorithm hashes the
+      terms, so no vocabulary is held, and fits an incremental PCA over
+       streamed chunks of documents that may not fit in memory.
+    """
+
+    def __init__(
+        self,
+        variance_threshold: float = settings.LSA_VARIANCE_THRESHOLD,
+        max_components: int = settings.LSA_MAX_COMPONENTS,
+        algorithm: str = settings.LSA_ALGORITHM,
+        stop_words: Optional[list[str]] = None,
+        n_features: int = settings.LSA_HASH_FEATURES,
+        batch_size: int = settings.LSA_BATCH_SIZE,
+        random_state: Optional[int] = 0,
+    ):
+        """
+        Initialize the engine.
+        :param variance_threshold: Cumulative explained variance ratio
+         the kept components must reach
+        :type variance_threshold: float
+        :param max_components: Number of components fitted before the
+         selection
+        :type max_components: int
+        :param algorithm: Either randomized, arpack or incremental
+        :type algorithm: str
+        :param stop_words: Stop words removed from the documents
+        :type stop_words: Optional[list[str]]
+        :param n_features: Number of hashed terms of the incremental
+         algorithm
+        :type n_features: int
+        :param batch_size: Rows densified at once by the incremental
+         algorithm
+        :type batch_size: int
+        :param random_state: Seed of the randomized algorithm
+        :type random_state: Optional[int]
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown LSA algorithm {algorithm}")
+        self.variance_threshold: float = variance_threshold
+        self.max_components: int = max_components
+        self.algorithm: str = algorithm
+        self.stop_words: Optional[list[str]] = stop_words
+        self.n_features: int = n_features
+        self.batch_size: int = batch_size
+        self.random_state: Optional[int] = random_state
+        self.vectorizer: Any = None
+        self.decomposition: Any = None
+        self.n_components: Optional[int] = None
+
+    @property
+    def explained_variance_ratio(self) -> np.ndarray:
+        """
+        Get the explained variance ratio of the kept components
+        :return: The ratio of each component
+        :rtype: np.ndarray
+        """
+        if self.decomposition is None:
+            raise ValueError("The LSA engine is not fitted")
+        return self.decomposition.explained_variance_ratio_
+
+    def _select_components(self) -> int:
+        """
+        Keep the smallest number of components reaching the variance
+         threshold, or all of them if the threshold is never reached
+        :return: The number of kept components
+        :rtype: int
+        """
+        cumulative: np.ndarray = np.cumsum(
+            self.decomposition.explained_variance_ratio_
+        )
+        reached: np.ndarray = np.flatnonzero(
+            cumulative >= self.variance_threshold
+        )
+        n_components: int = (
+            int(reached[0]) + 1 if reached.size else len(cumulative)
+        )
+        for attribute in (
+            "components_",
+            "explained_variance_",
+            "explained_variance_ratio_",
+            "singular_values_",
+        ):
+            setattr(
+                self.decomposition,
+                attribute,
+                getattr(self.decomposition, attribute)[:n_components],
+            )
+        self.decomposition.n_components = n_components
+        if hasattr(self.decomposition, "n_components_"):
+            self.decomposition.n_components_ = n_components
+        self.n_components = n_components
+        logger.info(
+            "LSA keeps %s components explaining %.1f%% of the variance",
+            n_components,
+            cumulative[n_components - 1] * 100,
+        )
+        return n_components
+
+    def fit_transform(self, documents: Iterable[str]) -> np.ndarray:
+        """
+        Fit the engine on documents held in memory and reduce them
+        :param documents: The documents to analyze
+        :type documents: Iterable[str]
+        :return: The reduced matrix of the documents
+        :rtype: np.ndarray
+        """
+        if self.algorithm == "incremental":
+            documents = list(documents)
+            self.fit_chunks([documents])
+            return self.transform(documents)
+        from sklearn.decomposition import TruncatedSVD
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        self.vectorizer = TfidfVectorizer(stop_words=self.stop_words)
+        tfidf_matrix: "csr_matrix" = self.vectorizer.fit_transform(documents)
+        self.decomposition = TruncatedSVD(
+            n_components=min(self.max_components, min(tfidf_matrix.shape) - 1),
+            algorithm=self.algorithm,
+            random_state=self.random_state,
+        )
+        reduced_matrix: np.ndarray = self.decomposition.fit_transform(
+            tfidf_matrix
+        )
+        return reduced_matrix[:, : self._select_components()]
+
+    def fit_chunks(self, chunks: Iterable[Iterable[str]]) -> "LSAEngine":
+        """
+        Fit the incremental algorithm on streamed chunks of documents
+        :param chunks: Chunks of documents, e.g. a text column read with
+         PersistenceManager.iter_load
+        :type chunks: Iterable[Iterable[str]]
+        :return: The fitted engine
+        :rtype: LSAEngine
+        """
+        if self.algorithm != "incremental":
+            raise ValueError("Only the incremental algorithm fits chunks")
+        self.vectorizer = None
+        self.n_components = None
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        if not hasattr(self.decomposition, "components_"):
+            raise ValueError("Not enough documents to fit")
+        self._select_components()
+        return self
+
+    def partial_fit(self, documents: Iterable[str]) -> "LSAEngine":
+        """
+        Update the incremental algorithm with a chunk of documents. The
+         components are selected by fit_chunks once every chunk is seen,
+          later updates keep the selected number of components
+        :param documents: A chunk of documents
+        :type documents: Iterable[str]
+        :return: The updated engine
+        :rtype: LSAEngine
+        """
+        from sklearn.decomposition import IncrementalPCA
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        if self.vectorizer is None:
+            self.vectorizer = HashingVectorizer(
+                n_features=self.n_features,
+                stop_words=self.stop_words,
+                alternate_sign=False,
+                dtype=np.float32,
+            )
+            self.decomposition = IncrementalPCA(
+                n_components=self.max_components
+            )
+        hashed_matrix: "csr_matrix" = self.vectorizer.transform(documents)
+        # Every batch must hold at least as many rows as components, so a
+        #  short last batch is merged into the previous one
+        batch_size: int = max(self.batch_size, self.max_components)
+        starts: list[int] = list(range(0, hashed_matrix.shape[0], batch_size))
+        if len(starts) > 1 and hashed_matrix.shape[0] - starts[-1] < (
+            self.max_components
+        ):
+            starts.pop()
+        for start, end in zip(starts, starts[1:] + [hashed_matrix.shape[0]]):
+            if end - start < self.max_components:
+                logger.warning(
+                    "Skipping %s documents, fewer than the %s components",
+                    end - start,
+                    self.max_components,
+                )
+                continue
+            self.decomposition.partial_fit(hashed_matrix[start:end].toarray())
+        return self
+
+    def transform(self, documents: Iterable[str]) -> np.ndarray:
+        """
+        Reduce new documents with the fitted vectorizer and components
+        :param documents: The documents to reduce
+        :type documents: Iterable[str]
+        :return: The reduced matrix of the documents
+        :rtype: np.ndarray
+        """
+        if self.n_components is None:
+            raise ValueError("The LSA engine is not fitted")
+        matrix: "csr_matrix" = self.vectorizer.transform(documents)
+        if self.algorithm != "incremental":
+            return self.decomposition.transform(matrix)
+        return np.vstack(
+            [
+                self.decomposition.transform(
+                    matrix[start : start + self.batch_size].toarray()
+                )
+                for start in range(0, matrix.shape[0], self.batch_size)
+            ]
+        )
+
+    def save(
+        self,
+        filename: str = "lsa.joblib",
+        data_type: Optional[DataType] = DataType.PROCESSED,
+    ) -> bool:
+        """
+        Save the fitted engine so later batches only need transform
+        :param filename: Name of the file
+        :type filename: str
+        :param data_type: Path where the engine will be saved
+        :type data_type: Optional[DataType]
+        :return: True if the file was created; otherwise false.
+        :rtype: bool
+        """
+        return PersistenceManager.save_object(self, data_type, filename)
+
+    @staticmethod
+    def load(
+        filename: str = "lsa.joblib",
+        data_type: Optional[DataType] = DataType.PROCESSED,
+    ) -> "LSAEngine":
+        """
+        Load an engine saved with save
+        :param filename: Name of the file
+        :type filename: str
+        :param data_type: Path where the engine was saved
+        :type data_type: Optional[DataType]
+        :return: The fitted engine
+        :rtype: LSAEngine
+        """
+        engine: LSAEngine = PersistenceManager.load_object(filename, data_type)
+        return engine
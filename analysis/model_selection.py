@@ -0,0 +1,180 @@
+"""
+A module for clustering model selection in the analysis package.
+"""
+import logging
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+from pydantic import BaseModel
+
+from core.config import settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ClusterScore(BaseModel):
+    """
+    Scores of a clustering fitted with a number of clusters
+    """
+
+    n_clusters: int
+    inertia: float
+    silhouette: Optional[float]
+    seconds: float
+
+
+class SweepResult(BaseModel):
+    """
+    Scores of every number of clusters tried by a sweep
+    """
+
+    scores: list[ClusterScore]
+    n_samples: int
+    silhouette_sample_size: int
+    mini_batch: bool
+
+    @property
+    def best_n_clusters(self) -> Optional[int]:
+        """
+        Get the number of clusters with the highest silhouette score
+        :return: The best number of clusters or None without silhouette
+        :rtype: Optional[int]
+        """
+        scored: list[ClusterScore] = [
+            score for score in self.scores if score.silhouette is not None
+        ]
+        if not scored:
+            return None
+        return max(scored, key=lambda score: score.silhouette).n_clusters
+
+    @property
+    def inertias(self) -> list[float]:
+        """
+        Get the within-cluster sum of squares of each number of clusters
+        :return: The inertias in the order of the sweep
+        :rtype: list[float]
+        """
+        return [score.inertia for score in self.scores]
+
+
+def _fit_and_score(
+    matrix: np.ndarray,
+    n_clusters: int,
+    sample_indices: Optional[np.ndarray],
+    mini_batch: bool,
+    n_init: int,
+    random_state: Optional[int],
+) -> ClusterScore:
+    """
+    Fit a clustering once and derive both its inertia and silhouette
+    :param matrix: The input matrix to cluster
+    :type matrix: np.ndarray
+    :param n_clusters: The number of clusters
+    :type n_clusters: int
+    :param sample_indices: Rows used for the silhouette score or None to
+     skip it
+    :type sample_indices: Optional[np.ndarray]
+    :param mini_batch: Whether to fit MiniBatchKMeans instead of KMeans
+    :type mini_batch: bool
+    :param n_init: Number of initializations of the clustering
+    :type n_init: int
+    :param random_state: Seed of the clustering
+    :type random_state: Optional[int]
+    :return: The scores of the clustering
+    :rtype: ClusterScore
+    """
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+    from sklearn.metrics import silhouette_score
+
+    start_time: float = perf_counter()
+    model: KMeans = (MiniBatchKMeans if mini_batch else KMeans)(
+        n_clusters=n_clusters, n_init=n_init, random_state=random_state
+    )
+    labels: np.ndarray = model.fit_predict(matrix)
+    silhouette: Optional[float] = None
+    if sample_indices is not None:
+        sample_labels: np.ndarray = labels[sample_indices]
+        if np.unique(sample_labels).size > 1:
+            silhouette = float(
+                silhouette_score(matrix[sample_indices], sample_labels)
+            )
+    return ClusterScore(
+        n_clusters=n_clusters,
+        inertia=float(model.inertia_),
+        silhouette=silhouette,
+        seconds=perf_counter() - start_time,
+    )
+
+
+def sweep_clusters(
+    matrix: np.ndarray,
+    n_clusters_range: range,
+    n_jobs: int = settings.SWEEP_N_JOBS,
+    silhouette_sample_size: int = settings.SILHOUETTE_SAMPLE_SIZE,
+    mini_batch: Optional[bool] = None,
+    n_init: int = 10,
+    random_state: Optional[int] = 0,
+) -> SweepResult:
+    """
+    Fit one clustering per number of clusters in parallel worker
+     processes and score each fit with both inertia and silhouette.
+    The silhouette, quadratic in the number of samples, is computed on a
+     random sample shared by every number of clusters.
+    :param matrix: The input matrix to cluster, e.g. the LSA reduced
+     matrix
+    :type matrix: np.ndarray
+    :param n_clusters_range: The range of cluster numbers to try
+    :type n_clusters_range: range
+    :param n_jobs: Number of worker processes, -1 for every CPU
+    :type n_jobs: int
+    :param silhouette_sample_size: Maximum rows used for the silhouette
+     score, 0 to skip it
+    :type silhouette_sample_size: int
+    :param mini_batch: Whether to fit MiniBatchKMeans. Defaults to True
+     above SWEEP_MINI_BATCH_THRESHOLD samples
+    :type mini_batch: Optional[bool]
+    :param n_init: Number of initializations of each clustering
+    :type n_init: int
+    :param random_state: Seed of the clusterings and the sample
+    :type random_state: Optional[int]
+    :return: The scores of every number of clusters
+    :rtype: SweepResult
+    """
+    from joblib import Parallel, delayed
+
+    n_samples: int = matrix.shape[0]
+    if mini_batch is None:
+        mini_batch = n_samples > settings.SWEEP_MINI_BATCH_THRESHOLD
+    sample_indices: Optional[np.ndarray] = None
+    if silhouette_sample_size:
+        sample_indices = (
+            np.random.default_rng(random_state).choice(
+                n_samples, silhouette_sample_size, replace=False
+            )
+            if n_samples > silhouette_sample_size
+            else np.arange(n_samples)
+        )
+    # Loky memory-maps the matrix for the workers instead of copying it
+    scores: list[ClusterScore] = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_fit_and_score)(
+            matrix, n_clusters, sample_indices, mini_batch, n_init, random_state
+        )
+        for n_clusters in n_clusters_range
+    )
+    for score in scores:
+        logger.info(
+            "n_clusters=%s inertia=%.4f silhouette=%s (%.2fs)",
+            score.n_clusters,
+            score.inertia,
+            score.silhouette,
+            score.seconds,
+        )
+    return SweepResult(
+        scores=scores,
+        n_samples=n_samples,
+        silhouette_sample_size=(
+            0 if sample_indices is None else len(sample_indices)
+        ),
+        mini_batch=mini_batch,
+    )
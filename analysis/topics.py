@@ -0,0 +1,205 @@
+"""
+A module for online topic modeling in the analysis package.
+"""
+import logging
+from typing import TYPE_CHECKING, Any, Iterable, Optional
+
+import numpy as np
+
+from core.config import settings
+from core.file_manager import DataType
+from core.persistence_manager import PersistenceManager
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def build_vocabulary(
+    documents: Iterable[str],
+    stop_words: Optional[list[str]] = None,
+    max_features: int = settings.LDA_MAX_FEATURES,
+) -> list[str]:
+    """
+    Build a fixed vocabulary from a sample of documents, keeping the
+     most frequent terms that are neither too rare nor too common
+    :param documents: A representative sample of documents
+    :type documents: Iterable[str]
+    :param stop_words: Stop words removed from the documents
+    :type stop_words: Optional[list[str]]
+    :param max_features: Maximum number of terms
+    :type max_features: int
+    :return: The vocabulary
+    :rtype: list[str]
+    """
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    vectorizer: CountVectorizer = CountVectorizer(
+        stop_words=stop_words, max_df=0.95, min_df=2, max_features=max_features
+    )
+    vectorizer.fit(documents)
+    return vectorizer.get_feature_names_out().tolist()
+
+
+class OnlineLDA:
+    """
+    Latent Dirichlet Allocation learned online from streamed chunks of
+     documents. Terms are counted with a fixed vocabulary when given or
+      hashed otherwise, so the vectorizer never has to be refitted.
+    """
+
+    def __init__(
+        self,
+        n_components: int = 2,
+        vocabulary: Optional[list[str]] = None,
+        stop_words: Optional[list[str]] = None,
+        n_features: int = settings.LDA_HASH_FEATURES,
+        batch_size: int = settings.LDA_BATCH_SIZE,
+        n_jobs: Optional[int] = settings.LDA_N_JOBS,
+        total_samples: int = 1000000,
+        random_state: Optional[int] = 0,
+    ):
+        """
+        Initialize the model.
+        :param n_components: Number of topics
+        :type n_components: int
+        :param vocabulary: Fixed vocabulary, e.g. from build_vocabulary.
+         Terms are hashed if None
+        :type vocabulary: Optional[list[str]]
+        :param stop_words: Stop words removed from the documents
+        :type stop_words: Optional[list[str]]
+        :param n_features: Number of hashed terms without vocabulary
+        :type n_features: int
+        :param batch_size: Documents per online update
+        :type batch_size: int
+        :param n_jobs: Number of parallel E-step jobs, -1 for every CPU
+        :type n_jobs: Optional[int]
+        :param total_samples: Expected total number of documents, used to
+         weight each update
+        :type total_samples: int
+        :param random_state: Seed of the model
+        :type random_state: Optional[int]
+        """
+        from sklearn.decomposition import LatentDirichletAllocation
+        from sklearn.feature_extraction.text import (
+            CountVectorizer,
+            HashingVectorizer,
+        )
+
+        self.vocabulary: Optional[list[str]] = vocabulary
+        self.vectorizer: Any = (
+            CountVectorizer(stop_words=stop_words, vocabulary=vocabulary)
+            if vocabulary
+            else HashingVectorizer(
+                n_features=n_features,
+                stop_words=stop_words,
+                alternate_sign=False,
+                norm=None,
+            )
+        )
+        self.batch_size: int = batch_size
+        self.model: LatentDirichletAllocation = LatentDirichletAllocation(
+            n_components=n_components,
+            learning_method="online",
+            batch_size=batch_size,
+            n_jobs=n_jobs,
+            total_samples=total_samples,
+            random_state=random_state,
+        )
+        self.n_documents: int = 0
+
+    def partial_fit(self, documents: Iterable[str]) -> "OnlineLDA":
+        """
+        Update the topics with a chunk of documents
+        :param documents: A chunk of documents
+        :type documents: Iterable[str]
+        :return: The updated model
+        :rtype: OnlineLDA
+        """
+        counts: "csr_matrix" = self.vectorizer.transform(documents)
+        for start in range(0, counts.shape[0], self.batch_size):
+            self.model.partial_fit(counts[start : start + self.batch_size])
+        self.n_documents += counts.shape[0]
+        return self
+
+    def fit_chunks(
+        self, chunks: Iterable[Iterable[str]], epochs: int = 1
+    ) -> "OnlineLDA":
+        """
+        Learn the topics from streamed chunks of documents
+        :param chunks: Chunks of documents, e.g. a text column read with
+         PersistenceManager.iter_load. Must be re-iterable if epochs > 1
+        :type chunks: Iterable[Iterable[str]]
+        :param epochs: Number of passes over the chunks
+        :type epochs: int
+        :return: The fitted model
+        :rtype: OnlineLDA
+        """
+        for _ in range(epochs):
+            for chunk in chunks:
+                self.partial_fit(chunk)
+        logger.info("Online LDA updated with %s documents", self.n_documents)
+        return self
+
+    def transform(self, documents: Iterable[str]) -> np.ndarray:
+        """
+        Infer the topic weights of documents without refitting
+        :param documents: The documents to score
+        :type documents: Iterable[str]
+        :return: A matrix of shape (n_samples, n_components) containing
+         the topic weights for each sample
+        :rtype: np.ndarray
+        """
+        return self.model.transform(self.vectorizer.transform(documents))
+
+    def top_terms(self, n_terms: int = 10) -> list[list[str]]:
+        """
+        Get the most weighted terms of each topic
+        :param n_terms: Number of terms per topic
+        :type n_terms: int
+        :return: The terms of each topic
+        :rtype: list[list[str]]
+        """
+        if not self.vocabulary:
+            raise ValueError("Hashed terms cannot be mapped back to words")
+        return [
+            [
+                self.vocabulary[index]
+                for index in topic.argsort()[::-1][:n_terms]
+            ]
+            for topic in self.model.components_
+        ]
+
+    def save(
+        self,
+        filename: str = "lda.joblib",
+        data_type: Optional[DataType] = DataType.PROCESSED,
+    ) -> bool:
+        """
+        Save the model so new documents are scored without refitting
+        :param filename: Name of the file
+        :type filename: str
+        :param data_type: Path where the model will be saved
+        :type data_type: Optional[DataType]
+        :return: True if the file was created; otherwise false.
+        :rtype: bool
+        """
+        return PersistenceManager.save_object(self, data_type, filename)
+
+    @staticmethod
+    def load(
+        filename: str = "lda.joblib",
+        data_type: Optional[DataType] = DataType.PROCESSED,
+    ) -> "OnlineLDA":
+        """
+        Load a model saved with save
+        :param filename: Name of the file
+        :type filename: str
+        :param data_type: Path where the model was saved
+        :type data_type: Optional[DataType]
+        :return: The fitted model
+        :rtype: OnlineLDA
+        """
+        model: OnlineLDA = PersistenceManager.load_object(filename, data_type)
+        return model
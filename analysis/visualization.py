@@ -1,20 +1,49 @@
 """
 A module for visualization in the analysis package.
 """
-import itertools
+import logging
+import os
 import re
-from typing import Any
+from concurrent.futures import Future, ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Iterable, Optional
 
+import matplotlib
 import numpy as np
 import pandas as pd
+
+from core.config import settings
+
+if settings.HEADLESS_PLOTS:
+    matplotlib.use("Agg")
 import seaborn as sns
-from matplotlib import cm
 from matplotlib import pyplot as plt
-from sklearn.cluster import KMeans
 
-from core.config import settings
+from analysis.evaluation import ConfusionPair, top_confusions
+from analysis.model_selection import SweepResult, sweep_clusters
 from core.file_manager import DataType
 
+logger: logging.Logger = logging.getLogger(__name__)
+FigureTask = tuple[Callable[..., None], tuple[Any, ...], dict[str, Any]]
+
+
+def _finish(figure: plt.Figure, filename: str) -> None:
+    """
+    Save a figure, show it unless plots are headless and close it so no
+     pyplot state outlives the function
+    :param figure: The figure to finish
+    :type figure: plt.Figure
+    :param filename: Path of the image to write
+    :type filename: str
+    :return: None
+    :rtype: NoneType
+    """
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    figure.savefig(filename)
+    if not settings.HEADLESS_PLOTS:
+        plt.show()
+    plt.close(figure)
+
 
 def plot_count(
     dataframe: pd.DataFrame,
@@ -35,22 +64,24 @@ def plot_count(
     :return: None
     :rtype: NoneType
     """
-    plt.figure(figsize=settings.FIG_SIZE)
+    figure: plt.Figure = plt.figure(figsize=settings.FIG_SIZE)
     plt.suptitle("Count-plot for Discrete variables")
     plot_iterator: int = 1
     for column in variables:
-        plt.subplot(1, 3, plot_iterator)
+        plt.subplot(1, len(variables), plot_iterator)
         sns.countplot(
             x=dataframe[column], hue=dataframe[hue], palette=settings.PALETTE
         )
         label: str = re.sub(
-            pattern=settings.RE_PATTERN, repl=settings.RE_REPL, string=column
+            pattern=settings.RE_PATTERN,
+            repl=settings.RE_REPL,
+            string=str(column),
         )
         plt.xlabel(label, fontsize=15)
         plt.ylabel("Count", fontsize=15)
         plot_iterator += 1
-        plt.savefig(f"{data_type.value}discrete_{column}.png")
-        plt.show()
+    columns: str = "_".join(map(str, variables))
+    _finish(figure, f"{data_type.value}discrete_{columns}.png")
 
 
 def plot_distribution(
@@ -73,12 +104,13 @@ def plot_distribution(
         repl=settings.RE_REPL,
         string=str(series.name),
     )
-    sns.displot(x=series, kde=True, color=color, height=8, aspect=1.875)
+    figure: plt.Figure = sns.displot(
+        x=series, kde=True, color=color, height=8, aspect=1.875
+    ).figure
     plt.title(f"Distribution Plot for {label}")
     plt.xlabel(label, fontsize=settings.FONT_SIZE)
     plt.ylabel("Frequency", fontsize=settings.FONT_SIZE)
-    plt.savefig(f"{data_type.value}{str(series.name)}.png")
-    plt.show()
+    _finish(figure, f"{data_type.value}{str(series.name)}.png")
 
 
 def boxplot_dist(
@@ -101,7 +133,7 @@ def boxplot_dist(
     :return: None
     :rtype: NoneType
     """
-    plt.figure(figsize=settings.FIG_SIZE)
+    figure: plt.Figure = plt.figure(figsize=settings.FIG_SIZE)
     x_label: str = re.sub(
         pattern=settings.RE_PATTERN,
         repl=settings.RE_REPL,
@@ -123,10 +155,10 @@ def boxplot_dist(
     )
     plt.xlabel(x_label, fontsize=settings.FONT_SIZE)
     plt.ylabel(y_label, fontsize=settings.FONT_SIZE)
-    plt.savefig(
-        f"{data_type.value}discrete_{first_variable}_{second_variable}.png"
+    _finish(
+        figure,
+        f"{data_type.value}discrete_{first_variable}_{second_variable}.png",
     )
-    plt.show()
 
 
 def plot_scatter(
@@ -151,7 +183,7 @@ def plot_scatter(
     :return: None
     :rtype: NoneType
     """
-    plt.figure(figsize=settings.FIG_SIZE)
+    figure: plt.Figure = plt.figure(figsize=settings.FIG_SIZE)
     sns.scatterplot(
         x=x_array, data=dataframe, y=y_array, hue=hue, palette=settings.PALETTE
     )
@@ -160,8 +192,7 @@ def plot_scatter(
     )
     plt.title(f"{x_array} Wise {label} Distribution")
     print(dataframe[[x_array, y_array]].corr())
-    plt.savefig(f"{data_type.value}{x_array}_{y_array}_{hue}.png")
-    plt.show()
+    _finish(figure, f"{data_type.value}{x_array}_{y_array}_{hue}.png")
 
 
 def plot_heatmap(
@@ -176,20 +207,20 @@ def plot_heatmap(
     :return: None
     :rtype: NoneType
     """
-    plt.figure(figsize=settings.FIG_SIZE)
+    figure: plt.Figure = plt.figure(figsize=settings.FIG_SIZE)
     sns.heatmap(data=dataframe.corr(), annot=True, cmap="RdYlGn")
     plt.title(
         "Heatmap showing correlations among columns",
         fontsize=settings.FONT_SIZE,
     )
-    plt.savefig(f"{data_type.value}correlations_heatmap.png")
-    plt.show()
+    _finish(figure, f"{data_type.value}correlations_heatmap.png")
 
 
 def elbow_method(
     matrix: np.ndarray,
     n_clusters_range: range,
     data_type: DataType = DataType.FIGURES,
+    sweep: Optional[SweepResult] = None,
 ) -> None:
     """
     Perform elbow method for KMeans clustering to determine optimal
@@ -200,20 +231,25 @@ def elbow_method(
     :type n_clusters_range: range
     :param data_type: folder where data will be saved. Defaults to FIGURES
     :type data_type: DataType
+    :param sweep: Result of silhouette_scores for the same range, to
+     reuse its fits instead of clustering again
+    :type sweep: Optional[SweepResult]
     :return: None
     :rtype: NoneType
     """
-    within_cluster_sum_square: list[float] = []
-    for i in n_clusters_range:
-        kmeans: KMeans = KMeans(n_clusters=i, n_init=10)
-        kmeans.fit(matrix)
-        within_cluster_sum_square.append(kmeans.inertia_)
-    plt.plot(n_clusters_range, within_cluster_sum_square)
+    if sweep is None:
+        sweep = sweep_clusters(
+            matrix, n_clusters_range, silhouette_sample_size=0
+        )
+    within_cluster_sum_square: list[float] = sweep.inertias
+    figure: plt.Figure = plt.figure()
+    plt.plot(
+        [score.n_clusters for score in sweep.scores], within_cluster_sum_square
+    )
     plt.title("Elbow Method")
     plt.xlabel("Number of clusters")
     plt.ylabel("Within-cluster sum of squares (WCSS)")
-    plt.savefig(f"{data_type.value}elbow.png")
-    plt.show()
+    _finish(figure, f"{data_type.value}elbow.png")
     print(within_cluster_sum_square)
 
 
@@ -233,6 +269,7 @@ def visualize_clusters(
     :return: None
     :rtype: NoneType
     """
+    figure: plt.Figure = plt.figure()
     plt.scatter(matrix[:, 0], matrix[:, 1], c=labels, cmap="rainbow")
     plt.title("Clusters")
     plt.xlabel("Feature 1")
@@ -241,8 +278,7 @@ def visualize_clusters(
     #     plt.Line2D([], [], color=cm.get_cmap("plasma", int(i / 2)),
     #                label=f"Group {i}") for i in range(2)]
     # plt.legend(handles=legend_handles)
-    plt.savefig(f"{data_type.value}clusters.png")
-    plt.show()
+    _finish(figure, f"{data_type.value}clusters.png")
     for i in range(np.unique(labels).shape[0]):
         cluster = matrix[labels == i]
         print("Cluster", i, ":")
@@ -264,10 +300,16 @@ def plot_confusion_matrix(
     name: str,
     normalize: bool = False,
     data_type: DataType = DataType.FIGURES,
-) -> None:
+    annotation_max_classes: int = settings.CONFUSION_ANNOTATION_MAX_CLASSES,
+    top_k: int = settings.CONFUSION_TOP_K,
+) -> list[ConfusionPair]:
     """
-    This function plots the Confusion Matrix of the test and pred arrays
-    :param conf_matrix:
+    This function plots the Confusion Matrix of the test and pred arrays.
+    Cells are annotated up to annotation_max_classes classes, larger
+     matrices are drawn as a plain image and summarized by their most
+      confused pairs instead
+    :param conf_matrix: Matrix whose rows are the true and columns the
+     predicted classes, e.g. from confusion_matrix_from_predictions
     :type conf_matrix: np.ndarray
     :param classes: List of class names
     :type classes: list[str]
@@ -278,41 +320,109 @@ def plot_confusion_matrix(
     :type normalize: bool
     :param data_type: folder where data will be saved. Defaults to FIGURES
     :type data_type: DataType
-    :return: None
-    :rtype: NoneType
+    :param annotation_max_classes: Maximum number of classes whose cells
+     are annotated and ticks labeled
+    :type annotation_max_classes: int
+    :param top_k: Number of most confused pairs to report
+    :type top_k: int
+    :return: The most confused pairs
+    :rtype: list[ConfusionPair]
     """
+    confusions: list[ConfusionPair] = top_confusions(
+        conf_matrix, classes, top_k
+    )
     if normalize:
-        conf_matrix = (
-            conf_matrix.astype("float") / conf_matrix.sum(axis=1)[:, np.newaxis]
+        support: np.ndarray = conf_matrix.sum(axis=1, keepdims=True)
+        conf_matrix = np.divide(
+            conf_matrix,
+            support,
+            out=np.zeros(conf_matrix.shape),
+            where=support > 0,
         )
         print("Normalized confusion matrix")
     else:
         print("Confusion matrix, without normalization")
     print(conf_matrix)
-    plt.figure(figsize=settings.FIG_SIZE)
-    plt.rcParams.update({"font.size": 16})
-    plt.imshow(
-        conf_matrix, interpolation="nearest", cmap=cm.get_cmap("viridis", 8)
-    )
-    plt.title("Confusion matrix")
-    plt.colorbar()
-    tick_marks = np.arange(len(classes))
-    plt.xticks(tick_marks, classes, rotation=45, color="blue")
-    plt.yticks(tick_marks, classes, color="blue")
-    fmt: str = ".2f" if normalize else "d"
-    thresh: float = conf_matrix.max(initial=0) / 2.0
-    for i, j in itertools.product(
-        range(conf_matrix.shape[0]), range(conf_matrix.shape[1])
-    ):
-        plt.text(
-            j,
-            i,
-            format(conf_matrix[i, j], fmt),
-            horizontalalignment="center",
-            color="red" if conf_matrix[i, j] > thresh else "black",
+    for pair in confusions:
+        print(
+            f"{pair.true_label} -> {pair.predicted_label}: {pair.count:g}"
+            f" ({pair.rate:.2%})"
+        )
+    annotate: bool = len(classes) <= annotation_max_classes
+    with plt.rc_context({"font.size": 16}):
+        figure: plt.Figure = plt.figure(figsize=settings.FIG_SIZE)
+        plt.imshow(
+            conf_matrix,
+            interpolation="nearest",
+            cmap=matplotlib.colormaps["viridis"].resampled(8),
         )
-    plt.tight_layout()
-    plt.ylabel("True label")
-    plt.xlabel("Predicted label")
-    plt.savefig(f"{data_type.value}{name}_confusion_matrix.png")
-    plt.show()
+        plt.title("Confusion matrix")
+        plt.colorbar()
+        if annotate:
+            tick_marks: np.ndarray = np.arange(len(classes))
+            plt.xticks(tick_marks, classes, rotation=45, color="blue")
+            plt.yticks(tick_marks, classes, color="blue")
+            labels: np.ndarray = np.char.mod(
+                "%.2f" if normalize else "%d", conf_matrix
+            )
+            red: np.ndarray = conf_matrix > conf_matrix.max(initial=0) / 2.0
+            for (i, j), label in np.ndenumerate(labels):
+                plt.text(
+                    j,
+                    i,
+                    label,
+                    horizontalalignment="center",
+                    color="red" if red[i, j] else "black",
+                )
+        else:
+            logger.info(
+                "Skipping annotations of the %s classes confusion matrix",
+                len(classes),
+            )
+        plt.tight_layout()
+        plt.ylabel("True label")
+        plt.xlabel("Predicted label")
+        _finish(figure, f"{data_type.value}{name}_confusion_matrix.png")
+    return confusions
+
+
+def _init_render_worker() -> None:
+    """
+    Make a render worker headless on the non-interactive Agg backend
+    :return: None
+    :rtype: NoneType
+    """
+    settings.HEADLESS_PLOTS = True
+    plt.switch_backend("Agg")
+
+
+def render_figures(
+    tasks: Iterable[FigureTask], workers: int = settings.RENDER_WORKERS
+) -> None:
+    """
+    Render the figures of a report in parallel headless worker
+     processes, each task being a plotting function of this module with
+      its positional and keyword arguments
+    :param tasks: The figures to render, e.g.
+     (plot_heatmap, (dataframe,), {})
+    :type tasks: Iterable[FigureTask]
+    :param workers: Maximum number of worker processes
+    :type workers: int
+    :return: None
+    :rtype: NoneType
+    """
+    start_time: float = perf_counter()
+    with ProcessPoolExecutor(
+        workers, initializer=_init_render_worker
+    ) as executor:
+        futures: list[Future[None]] = [
+            executor.submit(function, *args, **kwargs)
+            for function, args, kwargs in tasks
+        ]
+        for future in futures:
+            future.result()
+    logger.info(
+        "Rendered %s figures in %.2fs",
+        len(futures),
+        perf_counter() - start_time,
+    )
@@ -0,0 +1,169 @@
+"""
+A module for the inference server application in the api package.
+"""
+import gc
+import logging
+import multiprocessing
+import os
+import socket
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from api.batcher import MicroBatcher, QueueFullError
+from core.config import settings
+from models.bert_agent import BertAgent
+from models.registry import ModelRegistry
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette) -> AsyncIterator[None]:
+    """
+    Load the model once and run the micro-batcher for the lifetime of
+     the application
+    :param app: The Starlette application
+    :type app: Starlette
+    :return: An asynchronous iterator used as lifespan context
+    :rtype: AsyncIterator[None]
+    """
+    agent: BertAgent = await run_in_threadpool(BertAgent, settings.MODEL_NAME)
+    batcher: MicroBatcher = MicroBatcher(agent.predict_batch)
+    batcher.start()
+    app.state.batcher = batcher
+    logger.info("Inference server ready with model %s", settings.MODEL_NAME)
+    try:
+        yield
+    finally:
+        await batcher.stop()
+
+
+def _parse_texts(payload: Any) -> Optional[list[str]]:
+    """
+    Get the texts of a prediction request body, either a non-empty list
+     of strings under "texts" or a single string under "text"
+    :param payload: The decoded JSON body
+    :type payload: Any
+    :return: The texts or None if the body is invalid
+    :rtype: Optional[list[str]]
+    """
+    if not isinstance(payload, dict):
+        return None
+    if "texts" in payload:
+        texts: Any = payload["texts"]
+        if (
+            isinstance(texts, list)
+            and texts
+            and all(isinstance(text, str) for text in texts)
+        ):
+            return texts
+        return None
+    text: Any = payload.get("text")
+    return [text] if isinstance(text, str) else None
+
+
+async def predict(request: Request) -> JSONResponse:
+    """
+    Predict the labels of the texts in the request body, given either
+     as {"text": "..."} or {"texts": ["...", ...]}
+    :param request: The incoming HTTP request
+    :type request: Request
+    :return: The predicted labels and logits of each text
+    :rtype: JSONResponse
+    """
+    try:
+        payload: Any = await request.json()
+    except ValueError:
+        return JSONResponse(
+            {"detail": "Request body is not valid JSON"}, status_code=422
+        )
+    texts: Optional[list[str]] = _parse_texts(payload)
+    if texts is None:
+        return JSONResponse(
+            {"detail": "Expected a text string or a non-empty list of texts"},
+            status_code=422,
+        )
+    try:
+        logits: list[list[float]] = await request.app.state.batcher.submit(
+            texts
+        )
+    except QueueFullError as exc:
+        return JSONResponse(
+            {"detail": str(exc)}, status_code=503, headers={"Retry-After": "1"}
+        )
+    return JSONResponse(
+        {
+            "predictions": [
+                {"label": row.index(max(row)), "logits": row} for row in logits
+            ]
+        }
+    )
+
+
+async def health(request: Request) -> JSONResponse:
+    """
+    Report the server status and the current queue depth
+    :param request: The incoming HTTP request
+    :type request: Request
+    :return: The health status
+    :rtype: JSONResponse
+    """
+    return JSONResponse(
+        {"status": "ok", "queued": request.app.state.batcher.queue.qsize()}
+    )
+
+
+app: Starlette = Starlette(
+    routes=[
+        Route("/predict", predict, methods=["POST"]),
+        Route("/health", health, methods=["GET"]),
+    ],
+    lifespan=lifespan,
+)
+
+
+def serve(workers: int = settings.SERVER_WORKERS) -> None:
+    """
+    Run the inference server. With several workers the model is loaded
+     once in the parent process, which then forks the workers on a
+      shared listening socket so they share the weights copy-on-write.
+    :param workers: Number of server processes
+    :type workers: int
+    :return: None
+    :rtype: NoneType
+    """
+    config: uvicorn.Config = uvicorn.Config(
+        app, host=settings.SERVER_HOST, port=settings.SERVER_PORT
+    )
+    if workers <= 1:
+        uvicorn.Server(config).run()
+        return
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    dtype: str = "qint8" if settings.QUANTIZED_INFERENCE else "float32"
+    ModelRegistry.preload([settings.MODEL_NAME], [dtype])
+    gc.collect()
+    gc.freeze()
+    sock: socket.socket = config.bind_socket()
+    context = multiprocessing.get_context("fork")
+    processes: list[multiprocessing.process.BaseProcess] = [
+        context.Process(
+            target=uvicorn.Server(config).run, kwargs={"sockets": [sock]}
+        )
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    logger.info("Started %s inference workers", workers)
+    for process in processes:
+        process.join()
+
+
+if __name__ == '__main__':
+    serve()
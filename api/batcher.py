@@ -0,0 +1,149 @@
+"""
+A module for request micro-batching in the api package.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence
+
+from torch import Tensor
+
+from core.config import settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """
+    Exception raised when the micro-batcher queue is full
+    """
+
+
+class MicroBatcher:
+    """
+    Groups concurrent prediction requests into micro-batches and runs
+     them in a worker thread so the event loop is never blocked.
+    """
+
+    def __init__(
+        self,
+        predict: Callable[[Sequence[str]], Tensor],
+        max_batch_size: int = settings.BATCH_SIZE,
+        max_wait_ms: int = settings.BATCH_WAIT_MS,
+        max_queue_size: int = settings.MAX_QUEUE_SIZE,
+    ):
+        """
+        Initialize the micro-batcher.
+        :param predict: Function predicting the logits of a batch
+        :type predict: Callable[[Sequence[str]], Tensor]
+        :param max_batch_size: Maximum number of texts per batch
+        :type max_batch_size: int
+        :param max_wait_ms: Maximum time to wait for a batch to fill
+        :type max_wait_ms: int
+        :param max_queue_size: Maximum number of pending texts before
+         new requests are rejected
+        :type max_queue_size: int
+        """
+        self.predict: Callable[[Sequence[str]], Tensor] = predict
+        self.max_batch_size: int = max_batch_size
+        self.max_wait: float = max_wait_ms / 1000
+        self.queue: asyncio.Queue[
+            tuple[str, asyncio.Future[list[float]]]
+        ] = asyncio.Queue(max_queue_size)
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="inference"
+        )
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """
+        Start consuming the queue in the running event loop.
+        :return: None
+        :rtype: NoneType
+        """
+        self._task = asyncio.create_task(self._consume())
+
+    async def stop(self) -> None:
+        """
+        Stop consuming the queue and shut down the worker thread.
+        :return: None
+        :rtype: NoneType
+        """
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self.executor.shutdown(wait=True)
+
+    async def submit(self, texts: Sequence[str]) -> list[list[float]]:
+        """
+        Enqueue texts for prediction and wait for their logits.
+        :param texts: Texts to predict
+        :type texts: Sequence[str]
+        :return: The logits of each text
+        :rtype: list[list[float]]
+        """
+        if self.queue.maxsize - self.queue.qsize() < len(texts):
+            raise QueueFullError("Prediction queue is full")
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[list[float]]] = []
+        for text in texts:
+            future: asyncio.Future[list[float]] = loop.create_future()
+            self.queue.put_nowait((text, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _collect(
+        self,
+    ) -> list[tuple[str, asyncio.Future[list[float]]]]:
+        """
+        Wait for a first request and gather more until the batch is
+         full or the wait window elapses.
+        :return: The batch of texts and their pending futures
+        :rtype: list[tuple[str, asyncio.Future[list[float]]]]
+        """
+        batch: list[tuple[str, asyncio.Future[list[float]]]] = [
+            await self.queue.get()
+        ]
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        deadline: float = loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+            timeout: float = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return [(text, future) for text, future in batch if not future.done()]
+
+    async def _consume(self) -> None:
+        """
+        Run micro-batches through the model until cancelled.
+        :return: None
+        :rtype: NoneType
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+            texts: list[str] = [text for text, _ in batch]
+            try:
+                logits: Tensor = await loop.run_in_executor(
+                    self.executor, self.predict, texts
+                )
+            except Exception as exc:
+                logger.exception("Micro-batch of %s texts failed", len(texts))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), row in zip(batch, logits.tolist()):
+                if not future.done():
+                    future.set_result(row)
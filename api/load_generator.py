@@ -0,0 +1,119 @@
+"""
+A module for the local load generator in the api package.
+"""
+import argparse
+import asyncio
+import logging
+from statistics import quantiles
+from time import perf_counter
+
+import aiohttp
+
+from core.config import settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def _worker(
+    session: aiohttp.ClientSession,
+    url: str,
+    text: str,
+    requests: int,
+    latencies: list[float],
+    statuses: dict[int, int],
+) -> None:
+    """
+    Send sequential prediction requests and record their latencies
+    :param session: The HTTP client session
+    :type session: aiohttp.ClientSession
+    :param url: The prediction endpoint
+    :type url: str
+    :param text: The text to send in every request
+    :type text: str
+    :param requests: Number of requests to send
+    :type requests: int
+    :param latencies: Collected latencies in seconds
+    :type latencies: list[float]
+    :param statuses: Collected count of responses per status code
+    :type statuses: dict[int, int]
+    :return: None
+    :rtype: NoneType
+    """
+    for _ in range(requests):
+        start_time: float = perf_counter()
+        async with session.post(url, json={"text": text}) as response:
+            await response.read()
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+        latencies.append(perf_counter() - start_time)
+
+
+async def generate_load(
+    url: str, concurrency: int, requests: int, text: str
+) -> dict[str, float]:
+    """
+    Send concurrent prediction requests and summarize throughput and
+     latency percentiles
+    :param url: The prediction endpoint
+    :type url: str
+    :param concurrency: Number of concurrent clients
+    :type concurrency: int
+    :param requests: Number of requests per client
+    :type requests: int
+    :param text: The text to send in every request
+    :type text: str
+    :return: Throughput, latency percentiles and rejected requests
+    :rtype: dict[str, float]
+    """
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start_time: float = perf_counter()
+        await asyncio.gather(
+            *(
+                _worker(session, url, text, requests, latencies, statuses)
+                for _ in range(concurrency)
+            )
+        )
+        elapsed: float = perf_counter() - start_time
+    # quantiles needs at least two latencies
+    percentiles: list[float] = (
+        quantiles(latencies, n=100)
+        if len(latencies) > 1
+        else (latencies or [float("nan")]) * 99
+    )
+    return {
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": percentiles[49] * 1000,
+        "p95_ms": percentiles[94] * 1000,
+        "p99_ms": percentiles[98] * 1000,
+        "ok": statuses.get(200, 0),
+        "rejected": statuses.get(503, 0),
+    }
+
+
+if __name__ == '__main__':
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Local load generator for the inference server"
+    )
+    parser.add_argument(
+        "--url",
+        default=f"http://{settings.SERVER_HOST}:{settings.SERVER_PORT}"
+        f"/predict",
+    )
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--text", default="How do I reset my password?")
+    arguments: argparse.Namespace = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    logger.info(
+        "Load test results: %s",
+        asyncio.run(
+            generate_load(
+                arguments.url,
+                arguments.concurrency,
+                arguments.requests,
+                arguments.text,
+            )
+        ),
+    )
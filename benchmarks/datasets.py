@@ -0,0 +1,103 @@
+"""
+A module for synthetic benchmark datasets in the benchmarks package.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+VOCABULARY_SIZE: int = 2000
+CATEGORIES: tuple[str, ...] = ("billing", "account", "shipping", "returns")
+
+
+def make_vocabulary(size: int = VOCABULARY_SIZE, seed: int = 0) -> list[str]:
+    """
+    Generate a reproducible vocabulary of pseudo-words
+    :param size: Number of words
+    :type size: int
+    :param seed: Seed of the random generator
+    :type seed: int
+    :return: The vocabulary
+    :rtype: list[str]
+    """
+    generator: np.random.Generator = np.random.default_rng(seed)
+    letters: np.ndarray = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    return sorted(
+        {
+            "".join(generator.choice(letters, generator.integers(3, 9)))
+            for _ in range(size * 2)
+        }
+    )[:size]
+
+
+def make_dataframe(
+    n_rows: int, words_per_text: int = 20, seed: int = 0
+) -> pd.DataFrame:
+    """
+    Generate a reproducible conversation-like dataframe with numeric,
+     categorical, text and label columns and some missing values
+    :param n_rows: Number of rows
+    :type n_rows: int
+    :param words_per_text: Number of words of each text
+    :type words_per_text: int
+    :param seed: Seed of the random generator
+    :type seed: int
+    :return: The synthetic dataframe
+    :rtype: pd.DataFrame
+    """
+    generator: np.random.Generator = np.random.default_rng(seed)
+    vocabulary: np.ndarray = np.array(make_vocabulary(seed=seed))
+    # Zipf distributed word ids give a realistic long-tailed vocabulary
+    word_ids: np.ndarray = (
+        generator.zipf(1.3, (n_rows, words_per_text)) - 1
+    ) % len(vocabulary)
+    existing_feature: np.ndarray = generator.normal(50, 15, n_rows)
+    existing_feature[generator.random(n_rows) < 0.05] = np.nan
+    return pd.DataFrame(
+        {
+            "existing_feature": existing_feature,
+            "category": generator.choice(CATEGORIES, n_rows),
+            "text": [" ".join(words) for words in vocabulary[word_ids]],
+            "label": generator.integers(0, 2, n_rows),
+        }
+    )
+
+
+def make_tiny_model(directory: str, seed: int = 0) -> str:
+    """
+    Save a tiny randomly initialized BERT classifier and its tokenizer,
+     so model benchmarks run offline in seconds
+    :param directory: Folder where the model will be saved
+    :type directory: str
+    :param seed: Seed of the random generator
+    :type seed: int
+    :return: The folder of the saved model
+    :rtype: str
+    """
+    import torch
+    from transformers import (
+        BertConfig,
+        BertForSequenceClassification,
+        BertTokenizerFast,
+    )
+
+    torch.manual_seed(seed)
+    os.makedirs(directory, exist_ok=True)
+    vocab_file: str = os.path.join(directory, "vocab.txt")
+    special_tokens: list[str] = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    tokens: list[str] = special_tokens + make_vocabulary(seed=seed)
+    with open(vocab_file, "w", encoding="utf-8") as file:
+        file.write("\n".join(tokens))
+    BertTokenizerFast(vocab_file, model_max_length=128).save_pretrained(
+        directory
+    )
+    config: BertConfig = BertConfig(
+        vocab_size=len(tokens),
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=128,
+        max_position_embeddings=128,
+    )
+    BertForSequenceClassification(config).save_pretrained(directory)
+    return directory
@@ -0,0 +1,109 @@
+"""
+A module for the import-time benchmark in the benchmarks package.
+Each module is imported in a fresh interpreter; the benchmark fails if
+ an import exceeds its time budget or loads a heavy dependency that must
+  stay lazy.
+"""
+import argparse
+import json
+import logging
+import subprocess
+import sys
+from statistics import median
+from typing import Any
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+HEAVY_MODULES: tuple[str, ...] = (
+    "pandas",
+    "docx",
+    "openpyxl",
+    "pyarrow",
+    "matplotlib",
+    "seaborn",
+    "sklearn",
+    "torch",
+    "transformers",
+    "autochain",
+)
+IMPORT_BUDGETS: dict[str, tuple[float, tuple[str, ...]]] = {
+    "core.config": (0.5, HEAVY_MODULES),
+    "core.decorators": (0.5, HEAVY_MODULES),
+    "core.logging_config": (0.5, HEAVY_MODULES),
+    "core.persistence_manager": (0.5, HEAVY_MODULES),
+    "core.file_manager": (1.5, ("docx", "openpyxl", "torch")),
+    "analysis.analysis": (1.5, ("matplotlib", "seaborn", "sklearn", "torch")),
+    "models.autochain_config": (0.5, HEAVY_MODULES),
+    "main": (0.5, HEAVY_MODULES),
+}
+_PROBE: str = (
+    "import importlib, json, sys, time\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))"
+)
+
+
+def measure_import(module: str, repeats: int = 3) -> tuple[float, set[str]]:
+    """
+    Import a module in fresh interpreters and measure the median time
+    :param module: The dotted name of the module to import
+    :type module: str
+    :param repeats: Number of fresh interpreters to measure
+    :type repeats: int
+    :return: The median import time in seconds and the top-level names
+     of the modules loaded by the import
+    :rtype: tuple[float, set[str]]
+    """
+    timings: list[float] = []
+    loaded: set[str] = set()
+    for _ in range(repeats):
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            [sys.executable, "-c", _PROBE, module],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        probe: dict[str, Any] = json.loads(result.stdout.splitlines()[-1])
+        timings.append(probe["elapsed"])
+        loaded = {name.split(".")[0] for name in probe["modules"]}
+    return median(timings), loaded
+
+
+def run(tolerance: float = 1.0, repeats: int = 3) -> bool:
+    """
+    Check every module against its import budget
+    :param tolerance: Multiplier applied to every time budget
+    :type tolerance: float
+    :param repeats: Number of fresh interpreters per module
+    :type repeats: int
+    :return: True if every import is within budget; otherwise false
+    :rtype: bool
+    """
+    within_budget: bool = True
+    for module, (budget, forbidden) in IMPORT_BUDGETS.items():
+        elapsed, loaded = measure_import(module, repeats)
+        eager: list[str] = sorted(loaded.intersection(forbidden))
+        passed: bool = elapsed <= budget * tolerance and not eager
+        within_budget = within_budget and passed
+        logger.info(
+            "%s %s: %.3fs (budget %.3fs)%s",
+            "PASS" if passed else "FAIL",
+            module,
+            elapsed,
+            budget * tolerance,
+            f", eagerly imports {', '.join(eager)}" if eager else "",
+        )
+    return within_budget
+
+
+if __name__ == '__main__':
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Fail if module import time regresses"
+    )
+    parser.add_argument("--tolerance", type=float, default=1.0)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments: argparse.Namespace = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.exit(0 if run(arguments.tolerance, arguments.repeats) else 1)
@@ -0,0 +1,310 @@
+"""
+A module for the benchmark suite in the benchmarks package.
+It measures persistence, transformation, analysis and model paths on
+ synthetic datasets of several sizes, stores the results as JSON and
+  flags regressions against a previous run.
+"""
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from statistics import median
+from time import perf_counter
+from typing import Callable, Iterator, Optional
+
+import pandas as pd
+from pydantic import BaseModel
+
+from benchmarks.datasets import make_dataframe, make_tiny_model
+from core.config import settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+PERSISTENCE_FORMATS: tuple[str, ...] = (
+    "csv",
+    "xlsx",
+    "docx",
+    "parquet",
+    "feather",
+)
+MAX_SLOW_FORMAT_ROWS: int = 20000
+MAX_MODEL_ROWS: int = 5000
+Case = tuple[str, Callable[[], object]]
+
+
+class BenchmarkResult(BaseModel):
+    """
+    Timing of a benchmark case for a dataset size
+    """
+
+    name: str
+    rows: int
+    repeats: int
+    median_seconds: float
+    min_seconds: float
+    rows_per_second: float
+
+
+def time_case(
+    name: str, rows: int, function: Callable[[], object], repeats: int
+) -> BenchmarkResult:
+    """
+    Run a case after one warm-up call and keep the median timing
+    :param name: The name of the case
+    :type name: str
+    :param rows: The number of rows processed by the case
+    :type rows: int
+    :param function: The code to measure
+    :type function: Callable[[], object]
+    :param repeats: Number of timed runs
+    :type repeats: int
+    :return: The timing of the case
+    :rtype: BenchmarkResult
+    """
+    function()
+    timings: list[float] = []
+    for _ in range(repeats):
+        start_time: float = perf_counter()
+        function()
+        timings.append(perf_counter() - start_time)
+    result: BenchmarkResult = BenchmarkResult(
+        name=name,
+        rows=rows,
+        repeats=repeats,
+        median_seconds=median(timings),
+        min_seconds=min(timings),
+        rows_per_second=rows / median(timings) if median(timings) else 0.0,
+    )
+    logger.info(
+        "%s[%s]: %.4fs (%.0f rows/s)",
+        name,
+        rows,
+        result.median_seconds,
+        result.rows_per_second,
+    )
+    return result
+
+
+def persistence_cases(
+    dataframe: pd.DataFrame, directory: str
+) -> Iterator[Case]:
+    """
+    Build the save and load cases of every file format
+    :param dataframe: The synthetic dataset
+    :type dataframe: pd.DataFrame
+    :param directory: Folder for the benchmark files
+    :type directory: str
+    :return: Iterator of case names and callables
+    :rtype: Iterator[Case]
+    """
+    from core.persistence_manager import PersistenceManager
+
+    for ext in PERSISTENCE_FORMATS:
+        if ext in ("xlsx", "docx") and len(dataframe) > MAX_SLOW_FORMAT_ROWS:
+            continue
+        data: pd.DataFrame = dataframe[["text"]] if ext == "docx" else dataframe
+        path: str = os.path.join(directory, f"benchmark.{ext}")
+        yield f"persistence.save.{ext}", lambda data=data, path=path: (
+            PersistenceManager.save(data, None, path)
+        )
+        yield f"persistence.load.{ext}", lambda path=path: (
+            PersistenceManager.load(path)
+        )
+
+
+def analysis_cases(dataframe: pd.DataFrame) -> Iterator[Case]:
+    """
+    Build the transformation, topic modeling and clustering cases
+    :param dataframe: The synthetic dataset
+    :type dataframe: pd.DataFrame
+    :return: Iterator of case names and callables
+    :rtype: Iterator[Case]
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from analysis.analysis import (
+        kmeans_clustering,
+        latent_dirichlet_allocation,
+        latent_semantic_analysis,
+        silhouette_scores,
+    )
+    from engineering.transformation.transformation import transform_data
+
+    stop_words: list[str] = []
+    yield "transformation.transform_data", lambda: transform_data(
+        dataframe.copy()
+    )
+    yield "analysis.latent_semantic_analysis", lambda: (
+        latent_semantic_analysis(dataframe, "text", stop_words)
+    )
+    yield "analysis.latent_dirichlet_allocation", lambda: (
+        latent_dirichlet_allocation(dataframe, "text", stop_words)
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        matrix = latent_semantic_analysis(dataframe, "text", stop_words)
+    yield "analysis.kmeans_clustering", lambda: kmeans_clustering(matrix, 4)
+    yield "analysis.silhouette_scores", lambda: silhouette_scores(
+        matrix, range(2, 5)
+    )
+
+
+def model_cases(dataframe: pd.DataFrame, directory: str) -> Iterator[Case]:
+    """
+    Build the tokenization and inference cases on a tiny local model
+    :param dataframe: The synthetic dataset
+    :type dataframe: pd.DataFrame
+    :param directory: Folder for the tiny model
+    :type directory: str
+    :return: Iterator of case names and callables
+    :rtype: Iterator[Case]
+    """
+    from models.bert_agent import BertAgent
+
+    agent: BertAgent = BertAgent(
+        make_tiny_model(os.path.join(directory, "tiny-bert"))
+    )
+    texts: list[str] = dataframe["text"].head(MAX_MODEL_ROWS).tolist()
+    yield "model.tokenize_batch", lambda: list(
+        agent.tokenize_batch(texts, max_length=128)
+    )
+    yield "model.predict_batch", lambda: agent.predict_batch(
+        texts, max_length=128
+    )
+
+
+def run_suite(
+    sizes: list[int], repeats: int = 3, groups: Optional[list[str]] = None
+) -> list[BenchmarkResult]:
+    """
+    Run the benchmark cases of the selected groups for every size
+    :param sizes: Numbers of rows of the synthetic datasets
+    :type sizes: list[int]
+    :param repeats: Number of timed runs per case
+    :type repeats: int
+    :param groups: Groups of cases to run among persistence, analysis
+     and model. Defaults to all of them
+    :type groups: Optional[list[str]]
+    :return: The timing of every case
+    :rtype: list[BenchmarkResult]
+    """
+    groups = groups or ["persistence", "analysis", "model"]
+    results: list[BenchmarkResult] = []
+    for rows in sizes:
+        dataframe: pd.DataFrame = make_dataframe(rows)
+        with tempfile.TemporaryDirectory() as directory:
+            cases: list[Case] = []
+            if "persistence" in groups:
+                cases.extend(persistence_cases(dataframe, directory))
+            if "analysis" in groups:
+                cases.extend(analysis_cases(dataframe))
+            if "model" in groups:
+                cases.extend(model_cases(dataframe, directory))
+            for name, function in cases:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results.append(
+                        time_case(
+                            name,
+                            min(rows, MAX_MODEL_ROWS)
+                            if name.startswith("model.")
+                            else rows,
+                            function,
+                            repeats,
+                        )
+                    )
+    return results
+
+
+def save_results(results: list[BenchmarkResult], filename: str) -> None:
+    """
+    Store the results and the environment they were measured on as JSON
+    :param results: The timings to store
+    :type results: list[BenchmarkResult]
+    :param filename: Path of the JSON file
+    :type filename: str
+    :return: None
+    :rtype: NoneType
+    """
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with open(filename, "w", encoding=settings.ENCODING) as file:
+        json.dump(
+            {
+                "created_at": datetime.now().isoformat(),
+                "python": sys.version,
+                "platform": platform.platform(),
+                "results": [result.dict() for result in results],
+            },
+            file,
+            indent=2,
+        )
+
+
+def find_regressions(
+    results: list[BenchmarkResult], baseline_filename: str, threshold: float
+) -> list[str]:
+    """
+    Compare the results with a previous run and report the cases that
+     became slower than the threshold allows
+    :param results: The current timings
+    :type results: list[BenchmarkResult]
+    :param baseline_filename: Path of the JSON file of the previous run
+    :type baseline_filename: str
+    :param threshold: Maximum allowed ratio of current to baseline time
+    :type threshold: float
+    :return: A description of every regression
+    :rtype: list[str]
+    """
+    with open(baseline_filename, encoding=settings.ENCODING) as file:
+        baseline: dict[tuple[str, int], float] = {
+            (result["name"], result["rows"]): result["median_seconds"]
+            for result in json.load(file)["results"]
+        }
+    regressions: list[str] = []
+    for result in results:
+        previous: Optional[float] = baseline.get((result.name, result.rows))
+        if previous and result.median_seconds > previous * threshold:
+            regressions.append(
+                f"{result.name}[{result.rows}] took "
+                f"{result.median_seconds:.4f}s, baseline {previous:.4f}s"
+            )
+    return regressions
+
+
+if __name__ == '__main__':
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description="Benchmark suite on synthetic datasets"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 10000, 100000]
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--groups", nargs="+", choices=["persistence", "analysis", "model"]
+    )
+    parser.add_argument(
+        "--output",
+        default=f"reports/benchmarks/benchmark-"
+        f"{datetime.today().strftime(settings.FILE_DATETIME_FORMAT)}.json",
+    )
+    parser.add_argument("--baseline", help="JSON results of a previous run")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    arguments: argparse.Namespace = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    benchmark_results: list[BenchmarkResult] = run_suite(
+        arguments.sizes, arguments.repeats, arguments.groups
+    )
+    save_results(benchmark_results, arguments.output)
+    logger.info("Results written to %s", arguments.output)
+    if arguments.baseline:
+        found: list[str] = find_regressions(
+            benchmark_results, arguments.baseline, arguments.threshold
+        )
+        for regression in found:
+            logger.error("Regression: %s", regression)
+        sys.exit(1 if found else 0)
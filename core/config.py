@@ -2,8 +2,9 @@
 A module for config in the core package.
 """
 from functools import lru_cache
+from typing import Optional
 
-from pydantic import BaseSettings, PositiveInt
+from pydantic import BaseSettings, NonNegativeInt, PositiveFloat, PositiveInt
 
 
 class Settings(BaseSettings):
@@ -16,6 +17,36 @@ class Settings(BaseSettings):
     WIDTH: PositiveInt = 1000
     ENCODING: str = "UTF-8"
     CHUNK_SIZE: PositiveInt = 5000
+    COLUMNAR_COMPRESSION: str = "zstd"
+    METRICS_ENABLED: bool = True
+    METRICS_MAX_SAMPLES: PositiveInt = 10000
+    METRICS_TRACK_CPU: bool = False
+    METRICS_TRACK_MEMORY: bool = False
+    PROFILING_ENABLED: bool = False
+    PROFILER: str = "cprofile"
+    PROFILING_INTERVAL: PositiveFloat = 0.005
+    EXTRACTION_WORKERS: PositiveInt = 4
+    TRANSFORMATION_STAGES: list[str] = ["clean_data", "engineer_features"]
+    OPTIMIZE_DTYPES: bool = False
+    CATEGORY_MAX_RATIO: float = 0.5
+    PIPELINE_CACHE_ENABLED: bool = True
+    PIPELINE_CACHE_MAX_BYTES: PositiveInt = 2 * 1024**3
+    BATCH_SIZE: PositiveInt = 32
+    MAX_SEQUENCE_LENGTH: PositiveInt = 512
+    EPOCHS: PositiveInt = 3
+    LEARNING_RATE: PositiveFloat = 2e-5
+    WEIGHT_DECAY: float = 0.01
+    WARMUP_RATIO: float = 0.1
+    GRADIENT_ACCUMULATION_STEPS: PositiveInt = 1
+    DATALOADER_WORKERS: NonNegativeInt = 0
+    QUANTIZED_INFERENCE: bool = False
+    TORCH_NUM_THREADS: Optional[PositiveInt] = None
+    MODEL_NAME: str = "bert-base-uncased"
+    SERVER_HOST: str = "127.0.0.1"
+    SERVER_PORT: PositiveInt = 8000
+    SERVER_WORKERS: PositiveInt = 1
+    BATCH_WAIT_MS: NonNegativeInt = 10
+    MAX_QUEUE_SIZE: PositiveInt = 1024
     DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
     DATETIME_FORMAT: str = "%d.%m.%Y"
     FILE_DATETIME_FORMAT: str = "%d-%b-%Y-%H-%M-%S"
@@ -23,6 +54,26 @@ class Settings(BaseSettings):
         "[%(name)s][%(asctime)s][%(levelname)s][%(module)s]"
         "[%(funcName)s][%(lineno)d]: %(message)s"
     )
+    LOG_QUEUE_ENABLED: bool = False
+    LOG_JSON: bool = False
+    LOG_ROTATION: Optional[str] = None
+    LOG_MAX_BYTES: PositiveInt = 10 * 1024**2
+    LOG_BACKUP_COUNT: NonNegativeInt = 5
+    LOG_ROTATION_WHEN: str = "midnight"
+    LSA_VARIANCE_THRESHOLD: float = 0.9
+    LSA_MAX_COMPONENTS: PositiveInt = 100
+    LSA_ALGORITHM: str = "randomized"
+    LSA_HASH_FEATURES: PositiveInt = 2**14
+    LSA_BATCH_SIZE: PositiveInt = 1000
+    SWEEP_N_JOBS: int = -1
+    SILHOUETTE_SAMPLE_SIZE: NonNegativeInt = 10000
+    SWEEP_MINI_BATCH_THRESHOLD: PositiveInt = 100000
+    KMEANS_CHUNK_SIZE: PositiveInt = 10000
+    KMEANS_EPOCHS: PositiveInt = 3
+    LDA_HASH_FEATURES: PositiveInt = 2**16
+    LDA_MAX_FEATURES: PositiveInt = 20000
+    LDA_BATCH_SIZE: PositiveInt = 256
+    LDA_N_JOBS: Optional[int] = None
     NUMERICS: list[str] = [
         "uint8",
         "uint16",
@@ -36,6 +87,10 @@ class Settings(BaseSettings):
         "float32",
         "float64",
     ]
+    HEADLESS_PLOTS: bool = False
+    RENDER_WORKERS: PositiveInt = 4
+    CONFUSION_ANNOTATION_MAX_CLASSES: PositiveInt = 30
+    CONFUSION_TOP_K: PositiveInt = 10
     PALETTE: str = "pastel"
     FONT_SIZE: PositiveInt = 15
     FIG_SIZE: tuple[PositiveInt, PositiveInt] = (15, 8)
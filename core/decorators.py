@@ -3,11 +3,23 @@ This module provides decorators designed to provide additional
  functionality to the functions they are used with.
 """
 import functools
+import itertools
 import logging
-from time import perf_counter
-from typing import Any, Callable
+import threading
+import tracemalloc
+from time import perf_counter, process_time
+from typing import Any, Callable, Iterator
+
+from core.config import settings
+from core.metrics import metrics
+from core.profiling import profiling
 
 logger: logging.Logger = logging.getLogger(__name__)
+# Peak memory reached so far by every measured call in progress, in any
+#  thread, carried over the reset_peak of the calls starting meanwhile
+_peaks: dict[int, int] = {}
+_peaks_lock: threading.Lock = threading.Lock()
+_tokens: Iterator[int] = itertools.count()
 
 
 def with_logging(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -34,6 +46,8 @@ def with_logging(func: Callable[..., Any]) -> Callable[..., Any]:
         :rtype: Any
         """
         logger.info("Calling %s", func.__name__)
+        if settings.METRICS_ENABLED:
+            metrics.increment("calls_total", func.__qualname__)
         value = func(*args, **kwargs)
         logger.info("Finished %s", func.__name__)
         return value
@@ -44,7 +58,8 @@ def with_logging(func: Callable[..., Any]) -> Callable[..., Any]:
 def benchmark(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     This decorator provides a benchmarking feature by logging the
-     execution time of the decorated function
+     execution time of the decorated function and recording it in the
+      metrics registry
     :param func: The function to be executed
     :type func: Callable
     :return: The decorated function that logs its execution time
@@ -64,11 +79,97 @@ def benchmark(func: Callable[..., Any]) -> Callable[..., Any]:
         :return: The result of the decorated function's execution
         :rtype: Any
         """
-        start_time: float = perf_counter()
+        if not settings.METRICS_ENABLED:
+            start_time: float = perf_counter()
+            value = func(*args, **kwargs)
+            run_time: float = perf_counter() - start_time
+            logger.info(
+                "Execution of %s took %s seconds.", func.__name__, run_time
+            )
+            return value
+        return _measure(func, *args, **kwargs)
+
+    return wrapper
+
+
+def _measure(
+    func: Callable[..., Any], *args: tuple[Any, ...], **kwargs: dict[str, Any]
+) -> Any:
+    """
+    Execute a function recording its latency and, if enabled, its CPU
+     time and peak memory in the metrics registry.
+    The CPU time is the one of the whole process, so it includes thread
+     pools started by the function but not worker processes. The peak
+      memory is the process-wide tracemalloc peak during the call, so
+       it also counts allocations of other threads running meanwhile.
+    :param func: The function to be executed
+    :type func: Callable
+    :param args: Positional arguments to be passed to the function
+    :type args: tuple[Any, ...]
+    :param kwargs: Keyword arguments to be passed to the function
+    :type kwargs: dict[str, Any]
+    :return: The result of the function's execution
+    :rtype: Any
+    """
+    name: str = func.__qualname__
+    track_memory: bool = settings.METRICS_TRACK_MEMORY
+    if track_memory:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        with _peaks_lock:
+            current_peak: int = tracemalloc.get_traced_memory()[1]
+            for active in _peaks:
+                _peaks[active] = max(_peaks[active], current_peak)
+            token: int = next(_tokens)
+            _peaks[token] = 0
+            tracemalloc.reset_peak()
+    start_cpu: float = process_time()
+    start_time: float = perf_counter()
+    try:
         value = func(*args, **kwargs)
-        end_time: float = perf_counter()
-        run_time: float = end_time - start_time
-        logger.info("Execution of %s took %s seconds.", func.__name__, run_time)
-        return value
+    except Exception:
+        metrics.increment("errors_total", name)
+        raise
+    finally:
+        run_time: float = perf_counter() - start_time
+        metrics.observe("duration_seconds", name, run_time)
+        if settings.METRICS_TRACK_CPU:
+            metrics.observe("cpu_seconds", name, process_time() - start_cpu)
+        if track_memory:
+            with _peaks_lock:
+                peak: int = max(
+                    _peaks.pop(token), tracemalloc.get_traced_memory()[1]
+                )
+            metrics.observe("peak_memory_bytes", name, peak)
+    logger.info("Execution of %s took %s seconds.", func.__name__, run_time)
+    return value
+
+
+def profile(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    This decorator profiles each execution of the decorated function
+     with cProfile or a sampling profiler when profiling is enabled in
+      the settings, writing the results next to the logs
+    :param func: The function to be profiled
+    :type func: Callable
+    :return: The decorated function that may be profiled
+    :rtype: Callable
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Any:
+        """
+        A wrapper function that adds profiling functionality
+        :param args: Positional arguments to be passed to the decorated
+         function
+        :type args: tuple[Any, ...]
+        :param kwargs: Keyword arguments to be passed to the decorated
+         function
+        :type kwargs: dict[str, Any]
+        :return: The result of the decorated function's execution
+        :rtype: Any
+        """
+        with profiling(func.__qualname__):
+            return func(*args, **kwargs)
 
     return wrapper
@@ -1,15 +1,24 @@
 """
 A module for file manager in the core package.
 """
+import itertools
 import logging
 import os
+import uuid
+import zipfile
 from abc import ABC, abstractmethod
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
 
 import pandas as pd
-from docx import Document
+
+from core.config import settings
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -43,6 +52,25 @@ class FileManager(ABC):
         :rtype: pd.DataFrame
         """
 
+    @abstractmethod
+    def iter_load(
+        self,
+        filename: Union[str, Path],
+        data_type: Optional[DataType],
+        chunk_size: int = settings.CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Abstract method to lazily load data from file in chunks.
+        :param filename: The name of the file, including extension.
+        :type filename: Union[str, Path]
+        :param data_type: The path where data will be saved.
+        :type data_type: Optional[DataType]
+        :param chunk_size: Maximum number of rows per chunk.
+        :type chunk_size: int
+        :return: Iterator of dataframes with at most chunk_size rows.
+        :rtype: Iterator[pd.DataFrame]
+        """
+
     @abstractmethod
     def save(
         self,
@@ -62,28 +90,154 @@ class FileManager(ABC):
         :rtype: bool
         """
 
+    def iter_save(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        data_type: Optional[DataType],
+        filename: str,
+    ) -> bool:
+        """
+        Save an iterable of dataframe chunks to a single file. Formats
+         that cannot be appended to collect the chunks before saving.
+        :param chunks: DataFrame chunks to save.
+        :type chunks: Iterable[pd.DataFrame]
+        :param data_type: Path where data will be saved.
+        :type data_type: Optional[DataType]
+        :param filename: Name of the file.
+        :type filename: str
+        :return: True if the file was created; otherwise false.
+        :rtype: bool
+        """
+        frames: list[pd.DataFrame] = list(chunks)
+        if not frames:
+            return False
+        return self.save(
+            pd.concat(frames, ignore_index=True), data_type, filename
+        )
+
 
 class XLSXManager(FileManager):
-    def load(
-        self, filename: Union[str, Path], data_type: Optional[DataType]
-    ) -> pd.DataFrame:
+    """
+    File manager for Excel workbooks using openpyxl read-only and
+     write-only modes, so rows are streamed instead of loading or
+      building the whole workbook object model.
+    """
+
+    def _rows(
+        self,
+        filename: Union[str, Path],
+        data_type: Optional[DataType],
+        sheet_name: Optional[str] = None,
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Lazily yield the cell values of each row of a worksheet.
+        :param filename: The name of the file, including extension.
+        :type filename: Union[str, Path]
+        :param data_type: The path where data will be saved.
+        :type data_type: Optional[DataType]
+        :param sheet_name: Worksheet to read. Defaults to the active one
+        :type sheet_name: Optional[str]
+        :return: Iterator of row values, starting with the header
+        :rtype: Iterator[tuple[Any, ...]]
+        """
         if data_type:
             filename = os.path.join(data_type, filename)
-        return pd.read_excel(filename, engine="openpyxl")
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(filename, read_only=True, data_only=True)
+        try:
+            worksheet = workbook[sheet_name] if sheet_name else workbook.active
+            yield from worksheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+    def load(
+        self,
+        filename: Union[str, Path],
+        data_type: Optional[DataType],
+        sheet_name: Optional[str] = None,
+    ) -> pd.DataFrame:
+        rows: Iterator[tuple[Any, ...]] = self._rows(
+            filename, data_type, sheet_name
+        )
+        header: Optional[tuple[Any, ...]] = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        return pd.DataFrame(list(rows), columns=header)
+
+    def iter_load(
+        self,
+        filename: Union[str, Path],
+        data_type: Optional[DataType],
+        chunk_size: int = settings.CHUNK_SIZE,
+        sheet_name: Optional[str] = None,
+    ) -> Iterator[pd.DataFrame]:
+        rows: Iterator[tuple[Any, ...]] = self._rows(
+            filename, data_type, sheet_name
+        )
+        header: Optional[tuple[Any, ...]] = next(rows, None)
+        if header is None:
+            return
+        batch: list[tuple[Any, ...]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == chunk_size:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=header)
 
     def save(
         self,
         dataframe: pd.DataFrame,
         data_type: Optional[DataType],
         filename: str,
+        sheet_name: str = "Sheet1",
     ) -> bool:
-        if len(dataframe) == 0:
-            return False
+        return self.iter_save([dataframe], data_type, filename, sheet_name)
+
+    def iter_save(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        data_type: Optional[DataType],
+        filename: str,
+        sheet_name: str = "Sheet1",
+    ) -> bool:
+        """
+        Append the rows of each chunk to a write-only worksheet, which
+         flushes them to disk as they are added.
+        :param chunks: DataFrame chunks to save.
+        :type chunks: Iterable[pd.DataFrame]
+        :param data_type: Path where data will be saved.
+        :type data_type: Optional[DataType]
+        :param filename: Name of the file.
+        :type filename: str
+        :param sheet_name: Name of the worksheet to write
+        :type sheet_name: str
+        :return: True if the file was created; otherwise false.
+        :rtype: bool
+        """
         if data_type:
             filename = os.path.join(data_type, filename)
-        with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-            dataframe.to_excel(writer, index=False)
-        return True
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(sheet_name)
+        written: bool = False
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            if not written:
+                worksheet.append([str(column) for column in chunk.columns])
+                written = True
+            values: pd.DataFrame = chunk.astype(object).where(
+                chunk.notna(), None
+            )
+            for row in values.itertuples(index=False, name=None):
+                worksheet.append(row)
+        if written:
+            workbook.save(filename)
+        return written
 
 
 class CSVManager(FileManager):
@@ -94,6 +248,17 @@ class CSVManager(FileManager):
             filename = os.path.join(data_type, filename)
         return pd.read_csv(filename)
 
+    def iter_load(
+        self,
+        filename: Union[str, Path],
+        data_type: Optional[DataType],
+        chunk_size: int = settings.CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        if data_type:
+            filename = os.path.join(data_type, filename)
+        with pd.read_csv(filename, chunksize=chunk_size) as reader:
+            yield from reader
+
     def save(
         self,
         dataframe: pd.DataFrame,
@@ -107,16 +272,165 @@ class CSVManager(FileManager):
         dataframe.to_csv(filename, index=False)
         return True
 
+    def iter_save(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        data_type: Optional[DataType],
+        filename: str,
+    ) -> bool:
+        if data_type:
+            filename = os.path.join(data_type, filename)
+        written: bool = False
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            chunk.to_csv(
+                filename,
+                mode="a" if written else "w",
+                header=not written,
+                index=False,
+            )
+            written = True
+        return written
+
+
+_W: str = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_BODY: str = f"{_W}body"
+_W_P: str = f"{_W}p"
+_W_R: str = f"{_W}r"
+_RUN_TEXTS: dict[str, Optional[str]] = {
+    f"{_W}t": None,
+    f"{_W}tab": "\t",
+    f"{_W}br": "\n",
+    f"{_W}cr": "\n",
+}
+_DOCUMENT_PART: str = "word/document.xml"
+_CONTENT_TYPES: str = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'content-types">'
+    '<Default Extension="rels" ContentType="application/'
+    'vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+_RELATIONSHIPS: str = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    "</Relationships>"
+)
+_DOCUMENT_START: bytes = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<w:document xmlns:w="http://schemas.openxmlformats.org/'
+    b'wordprocessingml/2006/main"><w:body>'
+)
+_DOCUMENT_END: bytes = b"<w:sectPr/></w:body></w:document>"
+_INVALID_XML_CHARACTERS: str = "[\x00-\x08\x0b\x0c\x0e-\x1f]"
+
+
+def _paragraph_xml(dataframe: pd.DataFrame) -> pd.Series:
+    """
+    Build the XML of one paragraph per row with vectorized string
+     operations, joining the values of the columns with tabs.
+    :param dataframe: DataFrame to convert
+    :type dataframe: pd.DataFrame
+    :return: The paragraph XML of each row
+    :rtype: pd.Series
+    """
+    columns: list[pd.Series] = [
+        dataframe[column].astype(str).where(dataframe[column].notna(), "")
+        for column in dataframe.columns
+    ]
+    text: pd.Series = columns[0]
+    for column in columns[1:]:
+        text = text + "\t" + column
+    text = (
+        text.str.replace(_INVALID_XML_CHARACTERS, "", regex=True)
+        .str.replace("&", "&amp;", regex=False)
+        .str.replace("<", "&lt;", regex=False)
+        .str.replace(">", "&gt;", regex=False)
+        .str.replace(
+            "\t", '</w:t><w:tab/><w:t xml:space="preserve">', regex=False
+        )
+        .str.replace(
+            "\n", '</w:t><w:br/><w:t xml:space="preserve">', regex=False
+        )
+    )
+    return '<w:p><w:r><w:t xml:space="preserve">' + text + "</w:t></w:r></w:p>"
+
 
 class DOCXManager(FileManager):
-    def load(
+    """
+    File manager for Word documents reading and writing the document
+     XML directly instead of building a python-docx object model.
+    """
+
+    def paragraphs(
         self, filename: Union[str, Path], data_type: Optional[DataType]
-    ) -> pd.DataFrame:
+    ) -> Iterator[str]:
+        """
+        Lazily yield the text of the body paragraphs, parsing the
+         document XML incrementally from the zip archive and releasing
+          each paragraph once read. Like python-docx, only the runs
+           directly inside paragraphs of the body are read, so tables,
+            content controls, hyperlinks and text boxes are skipped.
+        :param filename: The name of the file, including extension.
+        :type filename: Union[str, Path]
+        :param data_type: The path where data will be saved.
+        :type data_type: Optional[DataType]
+        :return: Iterator of paragraph texts
+        :rtype: Iterator[str]
+        """
         if data_type:
             filename = os.path.join(data_type, filename)
-        doc = Document(filename)
-        text: list[Any] = [p.text for p in doc.paragraphs]
-        return pd.DataFrame(text)
+        from lxml import etree
+
+        with zipfile.ZipFile(filename) as archive, archive.open(
+            _DOCUMENT_PART
+        ) as document:
+            for _, element in etree.iterparse(document, tag=_W_P):
+                body: Any = element.getparent()
+                if body.tag != _W_BODY:
+                    continue
+                texts: list[str] = []
+                for run in element.iterchildren(_W_R):
+                    for child in run:
+                        if child.tag in _RUN_TEXTS:
+                            texts.append(
+                                _RUN_TEXTS[child.tag] or child.text or ""
+                            )
+                yield "".join(texts)
+                # Drop the paragraph and any table or content control
+                #  before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del body[0]
+
+    def load(
+        self, filename: Union[str, Path], data_type: Optional[DataType]
+    ) -> pd.DataFrame:
+        return pd.DataFrame(list(self.paragraphs(filename, data_type)))
+
+    def iter_load(
+        self,
+        filename: Union[str, Path],
+        data_type: Optional[DataType],
+        chunk_size: int = settings.CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        batch: list[str] = []
+        for paragraph in self.paragraphs(filename, data_type):
+            batch.append(paragraph)
+            if len(batch) == chunk_size:
+                yield pd.DataFrame(batch)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch)
 
     def save(
         self,
@@ -124,12 +438,220 @@ class DOCXManager(FileManager):
         data_type: Optional[DataType],
         filename: str,
     ) -> bool:
-        if len(dataframe) == 0:
+        return self.iter_save([dataframe], data_type, filename)
+
+    def iter_save(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        data_type: Optional[DataType],
+        filename: str,
+    ) -> bool:
+        """
+        Write one paragraph per row, with the values of the columns
+         separated by tabs, streaming the document XML into the archive
+          chunk by chunk. The archive is written to a temporary file next
+           to the target and moved over it once complete, so an existing
+            document is only replaced by a complete one.
+        :param chunks: DataFrame chunks to save.
+        :type chunks: Iterable[pd.DataFrame]
+        :param data_type: Path where data will be saved.
+        :type data_type: Optional[DataType]
+        :param filename: Name of the file.
+        :type filename: str
+        :return: True if the file was created; otherwise false.
+        :rtype: bool
+        """
+        rows: Iterator[pd.DataFrame] = (chunk for chunk in chunks if len(chunk))
+        first_chunk: Optional[pd.DataFrame] = next(rows, None)
+        if first_chunk is None:
             return False
         if data_type:
             filename = os.path.join(data_type, filename)
-        doc = Document()
-        for index, row in dataframe.iterrows():
-            doc.add_paragraph(str(row))
-        doc.save(filename)
+        temporary_filename: str = f"{filename}.{uuid.uuid4().hex}.tmp"
+        try:
+            with zipfile.ZipFile(
+                temporary_filename, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+            ) as archive:
+                archive.writestr("[Content_Types].xml", _CONTENT_TYPES)
+                archive.writestr("_rels/.rels", _RELATIONSHIPS)
+                with archive.open(_DOCUMENT_PART, "w") as document:
+                    document.write(_DOCUMENT_START)
+                    for chunk in itertools.chain([first_chunk], rows):
+                        document.write(
+                            "".join(_paragraph_xml(chunk)).encode("utf-8")
+                        )
+                    document.write(_DOCUMENT_END)
+            os.replace(temporary_filename, filename)
+        except BaseException:
+            if os.path.exists(temporary_filename):
+                os.remove(temporary_filename)
+            raise
         return True
+
+
+class ColumnarManager(FileManager):
+    """
+    File manager for Apache Arrow columnar formats (Parquet and
+     Feather) with column projection and predicate pushdown.
+    """
+
+    def __init__(
+        self, file_format: str = "parquet", preserve_index: bool = False
+    ):
+        """
+        Initialize the manager for a specific columnar format.
+        :param file_format: Either parquet or feather
+        :type file_format: str
+        :param preserve_index: Whether to store the dataframe index as a
+         column so it is restored on load. Defaults to False
+        :type preserve_index: bool
+        """
+        if file_format not in ("parquet", "feather"):
+            raise ValueError(f"Unsupported columnar format {file_format}")
+        self.file_format: str = file_format
+        self.preserve_index: bool = preserve_index
+
+    def _dataset(
+        self, filename: Union[str, Path], data_type: Optional[DataType]
+    ) -> "ds.Dataset":
+        """
+        Open the file as a lazily scanned Arrow dataset.
+        :param filename: The name of the file, including extension.
+        :type filename: Union[str, Path]
+        :param data_type: The path where data will be saved.
+        :type data_type: Optional[DataType]
+        :return: The dataset to scan
+        :rtype: ds.Dataset
+        """
+        if data_type:
+            filename = os.path.join(data_type, filename)
+        import pyarrow.dataset as ds
+
+        return ds.dataset(filename, format=self.file_format)
+
+    def load(
+        self,
+        filename: Union[str, Path],
+        data_type: Optional[DataType],
+        columns: Optional[list[str]] = None,
+        filters: Optional[list[Any]] = None,
+    ) -> pd.DataFrame:
+        """
+        Load data from a columnar file reading only the requested
+         columns and the row groups that satisfy the filters.
+        :param filename: The name of the file, including extension.
+        :type filename: Union[str, Path]
+        :param data_type: The path where data will be saved.
+        :type data_type: Optional[DataType]
+        :param columns: Columns to read. Defaults to all columns
+        :type columns: Optional[list[str]]
+        :param filters: Row filters in disjunctive normal form, e.g.
+         [("score", ">", 0.5)] or [[...], [...]]
+        :type filters: Optional[list[Any]]
+        :return: Dataframe retrieved from file.
+        :rtype: pd.DataFrame
+        """
+        import pyarrow.parquet as pq
+
+        table: pa.Table = self._dataset(filename, data_type).to_table(
+            columns=columns,
+            filter=pq.filters_to_expression(filters) if filters else None,
+        )
+        return table.to_pandas()
+
+    def iter_load(
+        self,
+        filename: Union[str, Path],
+        data_type: Optional[DataType],
+        chunk_size: int = settings.CHUNK_SIZE,
+        columns: Optional[list[str]] = None,
+        filters: Optional[list[Any]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        import pyarrow.parquet as pq
+
+        batches: Iterator[pa.RecordBatch] = self._dataset(
+            filename, data_type
+        ).to_batches(
+            columns=columns,
+            filter=pq.filters_to_expression(filters) if filters else None,
+            batch_size=chunk_size,
+        )
+        for batch in batches:
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def save(
+        self,
+        dataframe: pd.DataFrame,
+        data_type: Optional[DataType],
+        filename: str,
+    ) -> bool:
+        return self.iter_save([dataframe], data_type, filename)
+
+    def iter_save(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        data_type: Optional[DataType],
+        filename: str,
+    ) -> bool:
+        if data_type:
+            filename = os.path.join(data_type, filename)
+        import pyarrow as pa
+
+        writer: Optional[Union[pq.ParquetWriter, pa.ipc.RecordBatchFileWriter]]
+        writer = None
+        schema: Optional[pa.Schema] = None
+        try:
+            for chunk in chunks:
+                if len(chunk) == 0:
+                    continue
+                table: pa.Table = pa.Table.from_pandas(
+                    chunk, schema=schema, preserve_index=self.preserve_index
+                )
+                if writer is None:
+                    schema = table.schema
+                    writer = self._open_writer(filename, schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return writer is not None
+
+    def _open_writer(
+        self, filename: str, schema: "pa.Schema"
+    ) -> "Union[pq.ParquetWriter, pa.ipc.RecordBatchFileWriter]":
+        """
+        Open a compressed writer for the configured columnar format.
+        :param filename: The path of the file to write
+        :type filename: str
+        :param schema: The schema of the tables to write
+        :type schema: pa.Schema
+        :return: The opened writer
+        :rtype: Union[pq.ParquetWriter, pa.ipc.RecordBatchFileWriter]
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self.file_format == "parquet":
+            return pq.ParquetWriter(
+                filename,
+                schema,
+                compression=settings.COLUMNAR_COMPRESSION,
+            )
+        return pa.ipc.new_file(
+            filename,
+            schema,
+            options=pa.ipc.IpcWriteOptions(
+                compression=settings.COLUMNAR_COMPRESSION
+            ),
+        )
+
+
+class ParquetManager(ColumnarManager):
+    def __init__(self) -> None:
+        super().__init__("parquet")
+
+
+class FeatherManager(ColumnarManager):
+    def __init__(self) -> None:
+        super().__init__("feather")
@@ -1,16 +1,79 @@
 """
 This script sets up different logging handlers for the Core module.
 It provides console and file logging capabilities based on the
- provided settings.
+ provided settings, optionally behind a non-blocking queue.
 """
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+from typing import Any, Optional
 
 from pydantic import PositiveInt
 
 from core.config import Settings, get_settings
 
+_listener: Optional[QueueListener] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formatter writing each log record as a single JSON line
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format the record as a JSON object
+        :param record: The log record to format
+        :type record: logging.LogRecord
+        :return: The JSON line
+        :rtype: str
+        """
+        entry: dict[str, Any] = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "name": record.name,
+            "level": record.levelname,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queue handler enqueueing records unformatted, so the handlers of the
+     listener format them exactly as they would without the queue
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message arguments into a copy of the record, keeping
+         its exception and stack information for the listener handlers
+        :param record: The log record to enqueue
+        :type record: logging.LogRecord
+        :return: The record to enqueue
+        :rtype: logging.LogRecord
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
 
 def _setup_console_handler(
     logger: logging.Logger, log_level: PositiveInt
@@ -37,9 +100,16 @@ def _create_logs_folder(settings: Settings) -> str:
     :return: The path to the logs folder
     :rtype: str
     """
-    project_root: str = os.path.dirname(os.path.abspath(__file__))
+    package_root: str = os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))
+    )
+    project_root: str = package_root
     while os.path.basename(project_root) != settings.PROJECT_NAME:
-        project_root = os.path.dirname(project_root)
+        parent: str = os.path.dirname(project_root)
+        if parent == project_root:
+            project_root = package_root
+            break
+        project_root = parent
     logs_folder_path: str = f"{project_root}/logs"
     if not os.path.exists(logs_folder_path):
         os.makedirs(logs_folder_path, exist_ok=True)
@@ -72,13 +142,34 @@ def _configure_file_handler(
     :type log_level: PositiveInt
     :param settings: Dependency method for cached init setting object
     :type settings: Settings
-    :return: A configured file handler
+    :return: A configured file handler, rotating by size or time
+     depending on the settings
     :rtype: logging.FileHandle
     """
-    formatter: logging.Formatter = logging.Formatter(
-        settings.LOG_FORMAT, settings.DATE_FORMAT
+    formatter: logging.Formatter = (
+        JSONFormatter(datefmt=settings.DATE_FORMAT)
+        if settings.LOG_JSON
+        else logging.Formatter(settings.LOG_FORMAT, settings.DATE_FORMAT)
     )
-    file_handler: logging.FileHandler = logging.FileHandler(log_filename)
+    file_handler: logging.FileHandler
+    if settings.LOG_ROTATION == "size":
+        file_handler = RotatingFileHandler(
+            log_filename,
+            maxBytes=settings.LOG_MAX_BYTES,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding=settings.ENCODING,
+        )
+    elif settings.LOG_ROTATION == "time":
+        file_handler = TimedRotatingFileHandler(
+            log_filename,
+            when=settings.LOG_ROTATION_WHEN,
+            backupCount=settings.LOG_BACKUP_COUNT,
+            encoding=settings.ENCODING,
+        )
+    else:
+        file_handler = logging.FileHandler(
+            log_filename, encoding=settings.ENCODING
+        )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
     return file_handler
@@ -123,8 +214,45 @@ def setup_logging(
     :rtype: NoneType
     """
     logger: logging.Logger = logging.getLogger()
+    _stop_queue_listener()
     logger.handlers.clear()
     logger.propagate = False
     logger.setLevel(log_level)
     _setup_console_handler(logger, log_level)
     _setup_file_handler(logger, log_level, settings)
+    if settings.LOG_QUEUE_ENABLED:
+        _setup_queue_handler(logger)
+
+
+def _setup_queue_handler(logger: logging.Logger) -> None:
+    """
+    Move the handlers of the given logger behind an in-memory queue, so
+     log calls only enqueue records and a background listener thread
+      performs the blocking console and file I/O
+    :param logger: The logger instance whose handlers will be queued
+    :type logger: logging.Logger
+    :return: None
+    :rtype: NoneType
+    """
+    global _listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    handlers: list[logging.Handler] = list(logger.handlers)
+    logger.handlers.clear()
+    logger.addHandler(_RecordQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_stop_queue_listener)
+
+
+def _stop_queue_listener() -> None:
+    """
+    Stop the background listener, if any, flushing pending records
+    :return: None
+    :rtype: NoneType
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -0,0 +1,238 @@
+"""
+A module for the in-process metrics registry in the core package.
+"""
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Union
+
+from core.config import settings
+
+QUANTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """
+    Latency histogram keeping the count, sum and maximum of every
+     observation and a bounded window of recent samples for quantiles.
+    """
+
+    def __init__(self, max_samples: int = settings.METRICS_MAX_SAMPLES):
+        """
+        Initialize an empty histogram.
+        :param max_samples: Number of recent samples kept for quantiles
+        :type max_samples: int
+        """
+        self.samples: deque[float] = deque(maxlen=max_samples)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.maximum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Record an observation.
+        :param value: The observed value
+        :type value: float
+        :return: None
+        :rtype: NoneType
+        """
+        self.samples.append(value)
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, quantile: float) -> float:
+        """
+        Compute a quantile of the recent samples using the nearest rank.
+        :param quantile: The quantile between 0 and 1
+        :type quantile: float
+        :return: The value at the quantile or 0 without samples
+        :rtype: float
+        """
+        if not self.samples:
+            return 0.0
+        ordered: list[float] = sorted(self.samples)
+        rank: int = min(len(ordered) - 1, int(quantile * len(ordered)))
+        return ordered[rank]
+
+    def summary(self) -> dict[str, float]:
+        """
+        Summarize the histogram.
+        :return: The count, sum, mean, maximum and quantiles
+        :rtype: dict[str, float]
+        """
+        summary: dict[str, float] = {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.maximum,
+        }
+        for quantile in QUANTILES:
+            summary[f"p{int(quantile * 100)}"] = self.quantile(quantile)
+        return summary
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters, gauges and histograms labelled by
+     function name.
+    """
+
+    def __init__(self, max_samples: int = settings.METRICS_MAX_SAMPLES):
+        """
+        Initialize an empty registry.
+        :param max_samples: Number of recent samples kept per histogram
+        :type max_samples: int
+        """
+        self.max_samples: int = max_samples
+        self.counters: dict[tuple[str, str], float] = {}
+        self.gauges: dict[tuple[str, str], float] = {}
+        self.histograms: dict[tuple[str, str], Histogram] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def increment(self, metric: str, function: str, value: float = 1) -> None:
+        """
+        Increase a counter.
+        :param metric: The name of the metric
+        :type metric: str
+        :param function: The qualified name of the function measured
+        :type function: str
+        :param value: The amount to add
+        :type value: float
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            key: tuple[str, str] = (metric, function)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, metric: str, function: str, value: float) -> None:
+        """
+        Set a gauge to its current value.
+        :param metric: The name of the metric
+        :type metric: str
+        :param function: The qualified name of the function measured
+        :type function: str
+        :param value: The current value
+        :type value: float
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            self.gauges[(metric, function)] = value
+
+    def observe(self, metric: str, function: str, value: float) -> None:
+        """
+        Record an observation in a histogram.
+        :param metric: The name of the metric
+        :type metric: str
+        :param function: The qualified name of the function measured
+        :type function: str
+        :param value: The observed value
+        :type value: float
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            key: tuple[str, str] = (metric, function)
+            if key not in self.histograms:
+                self.histograms[key] = Histogram(self.max_samples)
+            self.histograms[key].observe(value)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Take a snapshot of every metric grouped by function.
+        :return: The metrics of each function
+        :rtype: dict[str, dict[str, Any]]
+        """
+        snapshot: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for (metric, function), value in self.counters.items():
+                snapshot.setdefault(function, {})[metric] = value
+            for (metric, function), value in self.gauges.items():
+                snapshot.setdefault(function, {})[metric] = value
+            for (metric, function), histogram in self.histograms.items():
+                snapshot.setdefault(function, {})[metric] = histogram.summary()
+        return snapshot
+
+    def to_json(self) -> str:
+        """
+        Export a snapshot in JSON format.
+        :return: The JSON document
+        :rtype: str
+        """
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self) -> str:
+        """
+        Export a snapshot in the Prometheus text exposition format, with
+         histograms exposed as summaries.
+        :return: The exposition text
+        :rtype: str
+        """
+        prefix: str = settings.PROJECT_NAME.replace("-", "_")
+        lines: list[str] = []
+        with self._lock:
+            for kind, metrics in (
+                ("counter", self.counters),
+                ("gauge", self.gauges),
+            ):
+                for metric in sorted({name for name, _ in metrics}):
+                    lines.append(f"# TYPE {prefix}_{metric} {kind}")
+                    lines.extend(
+                        f'{prefix}_{metric}{{function="{function}"}} {value}'
+                        for (name, function), value in metrics.items()
+                        if name == metric
+                    )
+            for metric in sorted({name for name, _ in self.histograms}):
+                lines.append(f"# TYPE {prefix}_{metric} summary")
+                for (name, function), histogram in self.histograms.items():
+                    if name != metric:
+                        continue
+                    for quantile in QUANTILES:
+                        lines.append(
+                            f'{prefix}_{metric}{{function="{function}",'
+                            f'quantile="{quantile}"}} '
+                            f"{histogram.quantile(quantile)}"
+                        )
+                    lines.append(
+                        f'{prefix}_{metric}_sum{{function="{function}"}} '
+                        f"{histogram.total}"
+                    )
+                    lines.append(
+                        f'{prefix}_{metric}_count{{function="{function}"}} '
+                        f"{histogram.count}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Union[str, Path]) -> None:
+        """
+        Write a snapshot to a file, in Prometheus text format for .prom
+         files and JSON otherwise.
+        :param path: The path of the file to write
+        :type path: Union[str, Path]
+        :return: None
+        :rtype: NoneType
+        """
+        content: str = (
+            self.to_prometheus()
+            if str(path).endswith(".prom")
+            else self.to_json()
+        )
+        with open(path, "w", encoding=settings.ENCODING) as file:
+            file.write(content)
+
+    def reset(self) -> None:
+        """
+        Remove every recorded metric.
+        :return: None
+        :rtype: NoneType
+        """
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+
+
+metrics: MetricsRegistry = MetricsRegistry()
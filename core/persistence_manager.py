@@ -2,64 +2,123 @@
 A module for persistence manager in the core package.
 """
 import logging
+import os
+from importlib import import_module
 from pathlib import Path
-from typing import Optional, Union
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
 
+from core.config import settings
 from core.decorators import benchmark, with_logging
-from core.file_manager import (
-    CSVManager,
-    DataType,
-    DOCXManager,
-    FileManager,
-    XLSXManager,
-)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from core.file_manager import DataType, FileManager
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 class PersistenceManager:
     """
-    Persistence Manager to handle different file types.
+    Persistence Manager to handle different file types. File managers
+     are imported and instantiated on first use of their extension.
     """
 
-    managers: dict[str, FileManager] = {
-        'xlsx': XLSXManager(),
-        'csv': CSVManager(),
-        'docx': DOCXManager(),
+    manager_paths: dict[str, str] = {
+        'xlsx': "core.file_manager.XLSXManager",
+        'csv': "core.file_manager.CSVManager",
+        'docx': "core.file_manager.DOCXManager",
+        'parquet': "core.file_manager.ParquetManager",
+        'feather': "core.file_manager.FeatherManager",
     }
+    managers: dict[str, "FileManager"] = {}
+
+    @classmethod
+    def get_manager(cls, filename: Union[str, Path]) -> Optional["FileManager"]:
+        """
+        Get the file manager for the extension of a file, importing it
+         the first time the extension is used.
+        :param filename: The name of the file including extension.
+        :type filename: Union[str, Path]
+        :return: The file manager or None if the extension is unknown
+        :rtype: Optional[FileManager]
+        """
+        ext: str = str(filename).split('.')[-1]
+        if ext not in cls.managers and ext in cls.manager_paths:
+            module_name, class_name = cls.manager_paths[ext].rsplit('.', 1)
+            cls.managers[ext] = getattr(
+                import_module(module_name), class_name
+            )()
+        return cls.managers.get(ext)
 
     @classmethod
     @with_logging
     @benchmark
     def load(
-        cls, filename: Union[str, Path], data_type: Optional[DataType] = None
-    ) -> pd.DataFrame:
+        cls,
+        filename: Union[str, Path],
+        data_type: Optional["DataType"] = None,
+        **kwargs: Any,
+    ) -> "pd.DataFrame":
         """
         Load data from a file of given extension.
         :param filename: The name of the file including extension.
         :type filename: Union[str, Path]
         :param data_type: Path where data will be saved.
         :type data_type: Optional[DataType]
+        :param kwargs: Format specific options forwarded to the file
+         manager, e.g. columns and filters for columnar files or
+          sheet_name for Excel files
+        :type kwargs: Any
         :return: Dataframe retrieved from file.
         :rtype: pd.DataFrame
         """
-        ext: str = str(filename).split('.')[-1]
-        manager: Optional[FileManager] = cls.managers.get(ext)
+        manager: Optional[FileManager] = cls.get_manager(filename)
         if manager:
-            return manager.load(filename, data_type)
+            return manager.load(filename, data_type, **kwargs)
         else:
+            ext: str = str(filename).split('.')[-1]
+            raise ValueError(f"No manager found for extension {ext}")
+
+    @classmethod
+    def iter_load(
+        cls,
+        filename: Union[str, Path],
+        data_type: Optional["DataType"] = None,
+        chunk_size: int = settings.CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Lazily load data from a file of given extension in chunks.
+        :param filename: The name of the file including extension.
+        :type filename: Union[str, Path]
+        :param data_type: Path where data will be saved.
+        :type data_type: Optional[DataType]
+        :param chunk_size: Maximum number of rows per chunk. Defaults
+         to the CHUNK_SIZE setting
+        :type chunk_size: int
+        :param kwargs: Format specific options forwarded to the file
+         manager
+        :type kwargs: Any
+        :return: Iterator of dataframes retrieved from file.
+        :rtype: Iterator[pd.DataFrame]
+        """
+        manager: Optional[FileManager] = cls.get_manager(filename)
+        if not manager:
+            ext: str = str(filename).split('.')[-1]
             raise ValueError(f"No manager found for extension {ext}")
+        logger.info("Streaming %s in chunks of %s rows", filename, chunk_size)
+        return manager.iter_load(filename, data_type, chunk_size, **kwargs)
 
     @classmethod
     @with_logging
     @benchmark
     def save(
         cls,
-        dataframe: pd.DataFrame,
-        data_type: Optional[DataType] = None,
+        dataframe: "pd.DataFrame",
+        data_type: Optional["DataType"] = None,
         filename: str = "processed_data.xlsx",
+        **kwargs: Any,
     ) -> bool:
         """
         Save data to a file of given extension.
@@ -69,11 +128,91 @@ class PersistenceManager:
         :type data_type: Optional[DataType]
         :param filename: Name of the file.
         :type filename: str
+        :param kwargs: Format specific options forwarded to the file
+         manager, e.g. sheet_name for Excel files
+        :type kwargs: Any
         :return: True if the file was created; otherwise false.
         :rtype: bool
         """
-        ext: str = filename.split('.')[-1]
-        manager: Optional[FileManager] = cls.managers.get(ext)
+        manager: Optional[FileManager] = cls.get_manager(filename)
         return (
-            manager.save(dataframe, data_type, filename) if manager else False
+            manager.save(dataframe, data_type, filename, **kwargs)
+            if manager
+            else False
         )
+
+    @classmethod
+    @with_logging
+    @benchmark
+    def iter_save(
+        cls,
+        chunks: Iterable["pd.DataFrame"],
+        data_type: Optional["DataType"] = None,
+        filename: str = "processed_data.csv",
+        **kwargs: Any,
+    ) -> bool:
+        """
+        Save dataframe chunks incrementally to a file of given extension.
+        :param chunks: DataFrame chunks to save.
+        :type chunks: Iterable[pd.DataFrame]
+        :param data_type: Path where data will be saved.
+        :type data_type: Optional[DataType]
+        :param filename: Name of the file.
+        :type filename: str
+        :param kwargs: Format specific options forwarded to the file
+         manager, e.g. sheet_name for Excel files
+        :type kwargs: Any
+        :return: True if the file was created; otherwise false.
+        :rtype: bool
+        """
+        manager: Optional[FileManager] = cls.get_manager(filename)
+        return (
+            manager.iter_save(chunks, data_type, filename, **kwargs)
+            if manager
+            else False
+        )
+
+    @staticmethod
+    def save_object(
+        obj: Any,
+        data_type: Optional["DataType"] = None,
+        filename: str = "model.joblib",
+    ) -> bool:
+        """
+        Save a fitted object such as a model or vectorizer with joblib.
+        :param obj: The object to save.
+        :type obj: Any
+        :param data_type: Path where the object will be saved.
+        :type data_type: Optional[DataType]
+        :param filename: Name of the file.
+        :type filename: str
+        :return: True if the file was created; otherwise false.
+        :rtype: bool
+        """
+        import joblib
+
+        if data_type:
+            filename = os.path.join(data_type, filename)
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        joblib.dump(obj, filename)
+        logger.info("Saved %s to %s", type(obj).__name__, filename)
+        return True
+
+    @staticmethod
+    def load_object(
+        filename: Union[str, Path], data_type: Optional["DataType"] = None
+    ) -> Any:
+        """
+        Load an object saved with save_object.
+        :param filename: The name of the file including extension.
+        :type filename: Union[str, Path]
+        :param data_type: Path where the object was saved.
+        :type data_type: Optional[DataType]
+        :return: The loaded object.
+        :rtype: Any
+        """
+        import joblib
+
+        if data_type:
+            filename = os.path.join(data_type, filename)
+        return joblib.load(filename)
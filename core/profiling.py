@@ -0,0 +1,147 @@
+"""
+A module for opt-in profiling in the core package.
+It captures either deterministic cProfile statistics or low-overhead
+ sampled stacks and writes them next to the logs.
+"""
+import cProfile
+import itertools
+import logging
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from types import FrameType
+from typing import Iterator, Optional
+
+from core.config import settings
+from core.logging_config import _create_logs_folder
+
+logger: logging.Logger = logging.getLogger(__name__)
+_sequence: Iterator[int] = itertools.count()
+
+
+class StackSampler(threading.Thread):
+    """
+    Background thread sampling the call stack of a target thread at a
+     fixed interval and counting identical stacks.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Initialize the sampler for a thread.
+        :param thread_id: Identifier of the thread to sample
+        :type thread_id: int
+        :param interval: Seconds between two samples
+        :type interval: float
+        """
+        super().__init__(name="stack-sampler", daemon=True)
+        self.thread_id: int = thread_id
+        self.interval: float = interval
+        self.stacks: Counter[str] = Counter()
+        self._stopped: threading.Event = threading.Event()
+
+    def run(self) -> None:
+        """
+        Sample the target thread until stopped.
+        :return: None
+        :rtype: NoneType
+        """
+        while not self._stopped.wait(self.interval):
+            frame: Optional[FrameType] = sys._current_frames().get(
+                self.thread_id
+            )
+            if frame is None:
+                continue
+            calls: list[str] = []
+            while frame is not None:
+                code = frame.f_code
+                calls.append(
+                    f"{os.path.basename(code.co_filename)}:{code.co_name}"
+                )
+                frame = frame.f_back
+            self.stacks[";".join(reversed(calls))] += 1
+
+    def stop(self) -> None:
+        """
+        Stop sampling and wait for the thread to finish.
+        :return: None
+        :rtype: NoneType
+        """
+        self._stopped.set()
+        self.join()
+
+    def dump(self, filename: str) -> None:
+        """
+        Write the sampled stacks in the collapsed format used by flame
+         graph tools, one "frame;frame;frame count" line per stack.
+        :param filename: The path of the file to write
+        :type filename: str
+        :return: None
+        :rtype: NoneType
+        """
+        with open(filename, "w", encoding=settings.ENCODING) as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+def _build_profile_path(name: str) -> str:
+    """
+    Build a unique path, without extension, for a profile in the
+     profiles folder inside the logs folder.
+    :param name: The name of the profiled code
+    :type name: str
+    :return: The path of the profile without extension
+    :rtype: str
+    """
+    folder: str = os.path.join(_create_logs_folder(settings), "profiles")
+    os.makedirs(folder, exist_ok=True)
+    timestamp: str = datetime.today().strftime(settings.FILE_DATETIME_FORMAT)
+    return os.path.join(
+        folder, f"{name}-{timestamp}-{os.getpid()}-{next(_sequence)}"
+    )
+
+
+@contextmanager
+def profiling(name: str, profiler: Optional[str] = None) -> Iterator[None]:
+    """
+    Profile the enclosed code if profiling is enabled in the settings.
+     The cprofile profiler writes a .pstats file and the sampling
+      profiler writes a .collapsed stacks file.
+    :param name: The name of the profiled code used in the filename
+    :type name: str
+    :param profiler: Either cprofile or sampling. Defaults to the
+     PROFILER setting
+    :type profiler: Optional[str]
+    :return: An iterator used as context manager
+    :rtype: Iterator[None]
+    """
+    if not settings.PROFILING_ENABLED:
+        yield
+        return
+    profiler = profiler or settings.PROFILER
+    if profiler == "sampling":
+        sampler: StackSampler = StackSampler(
+            threading.get_ident(), settings.PROFILING_INTERVAL
+        )
+        sampler.start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            filename: str = f"{_build_profile_path(name)}.collapsed"
+            sampler.dump(filename)
+            logger.info("Sampled stacks of %s written to %s", name, filename)
+    elif profiler == "cprofile":
+        cprofiler: cProfile.Profile = cProfile.Profile()
+        cprofiler.enable()
+        try:
+            yield
+        finally:
+            cprofiler.disable()
+            filename = f"{_build_profile_path(name)}.pstats"
+            cprofiler.dump_stats(filename)
+            logger.info("Profile of %s written to %s", name, filename)
+    else:
+        raise ValueError(f"Unknown profiler {profiler}")
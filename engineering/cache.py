@@ -0,0 +1,276 @@
+"""
+A module for the content-addressed pipeline cache in the engineering
+ package.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+import pandas as pd
+
+from core.config import settings
+from core.file_manager import ColumnarManager, DataType
+
+logger: logging.Logger = logging.getLogger(__name__)
+_SETTING_PATTERN: re.Pattern[str] = re.compile(r"\bsettings\.([A-Z][A-Z0-9_]*)")
+
+
+def hash_file(filepath: Union[str, Path]) -> str:
+    """
+    Compute the SHA-256 digest of a file's content without loading it
+     entirely into memory.
+    :param filepath: The path of the file to hash
+    :type filepath: Union[str, Path]
+    :return: The hexadecimal digest of the file
+    :rtype: str
+    """
+    with open(filepath, "rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def _step_source(step: Callable[..., Any]) -> bytes:
+    """
+    Get the source code of the module defining a step, so editing the
+     helpers it calls also changes the fingerprint
+    :param step: The transformation callable
+    :type step: Callable[..., Any]
+    :return: The encoded source code, or the bytecode of the step if its
+     source is not available
+    :rtype: bytes
+    """
+    try:
+        return inspect.getsource(inspect.getmodule(step) or step).encode()
+    except (OSError, TypeError):
+        return step.__code__.co_code
+
+
+def fingerprint_steps(steps: Iterable[Callable[..., Any]]) -> str:
+    """
+    Compute a version fingerprint of the given transformation steps
+     based on their qualified names, the source code of their modules,
+      their bound and default arguments and the current value of every
+       setting their modules read, so changing any of them invalidates
+        the cached results.
+    :param steps: The transformation callables applied by the pipeline,
+     optionally wrapped in functools.partial
+    :type steps: Iterable[Callable[..., Any]]
+    :return: The hexadecimal digest of the steps
+    :rtype: str
+    """
+    digest = hashlib.sha256()
+    for step in steps:
+        arguments: tuple[Any, ...] = ()
+        keywords: dict[str, Any] = {}
+        while isinstance(step, functools.partial):
+            arguments = step.args + arguments
+            keywords = {**step.keywords, **keywords}
+            step = step.func
+        digest.update(f"{step.__module__}.{step.__qualname__}".encode())
+        source: bytes = _step_source(step)
+        digest.update(source)
+        digest.update(
+            repr(
+                (
+                    arguments,
+                    sorted(keywords.items()),
+                    getattr(step, "__defaults__", None),
+                    getattr(step, "__kwdefaults__", None),
+                )
+            ).encode()
+        )
+        for name in sorted(
+            set(_SETTING_PATTERN.findall(source.decode(errors="ignore")))
+        ):
+            digest.update(f"{name}={getattr(settings, name, None)!r}".encode())
+    return digest.hexdigest()
+
+
+def _dtype_name(dtype: Any) -> str:
+    """
+    Get a name of a dtype that astype maps back to the same dtype,
+     including the storage of string dtypes
+    :param dtype: The dtype of a column
+    :type dtype: Any
+    :return: The name of the dtype
+    :rtype: str
+    """
+    if isinstance(dtype, pd.StringDtype):
+        return f"string[{dtype.storage}]"
+    return str(dtype)
+
+
+class PipelineCache:
+    """
+    On-disk cache of processed dataframes keyed by the input file
+     content and the transformation steps fingerprint, with size-based
+      least recently used eviction.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = settings.PIPELINE_CACHE_MAX_BYTES,
+        data_type: DataType = DataType.PROCESSED,
+        folder: str = "cache",
+    ):
+        """
+        Initialize the pipeline cache.
+        :param max_bytes: Maximum total size of the cached files
+        :type max_bytes: int
+        :param data_type: The path where cached data will be saved
+        :type data_type: DataType
+        :param folder: Subfolder of data_type holding the cached files
+        :type folder: str
+        """
+        self.max_bytes: int = max_bytes
+        self.directory: str = os.path.join(data_type.value, folder)
+        self.manager: ColumnarManager = ColumnarManager(
+            "feather", preserve_index=True
+        )
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def build_key(
+        self, filepath: Union[str, Path], steps: Iterable[Callable[..., Any]]
+    ) -> str:
+        """
+        Build the cache key for an input file and transformation steps.
+        :param filepath: The path of the raw input file
+        :type filepath: Union[str, Path]
+        :param steps: The transformation callables applied to the file
+        :type steps: Iterable[Callable[..., Any]]
+        :return: The cache key
+        :rtype: str
+        """
+        return f"{hash_file(filepath)[:32]}-{fingerprint_steps(steps)[:16]}"
+
+    def _path(self, key: str) -> str:
+        """
+        Get the path of the cached file for a key.
+        :param key: The cache key
+        :type key: str
+        :return: The path of the cached file
+        :rtype: str
+        """
+        return os.path.join(self.directory, f"{key}.feather")
+
+    def _dtypes_path(self, key: str) -> str:
+        """
+        Get the path of the dtypes saved next to the cached file for a
+         key, since Feather restores pyarrow-backed strings as python
+          strings
+        :param key: The cache key
+        :type key: str
+        :return: The path of the dtypes file
+        :rtype: str
+        """
+        return os.path.join(self.directory, f"{key}.dtypes.json")
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Retrieve a cached dataframe, refreshing its recency on a hit.
+        :param key: The cache key
+        :type key: str
+        :return: The cached dataframe or None on a miss
+        :rtype: Optional[pd.DataFrame]
+        """
+        path: str = self._path(key)
+        if not (
+            os.path.exists(path) and os.path.exists(self._dtypes_path(key))
+        ):
+            self.misses += 1
+            logger.info(
+                "Pipeline cache miss for %s (hits=%s, misses=%s)",
+                key,
+                self.hits,
+                self.misses,
+            )
+            return None
+        os.utime(path)
+        self.hits += 1
+        logger.info(
+            "Pipeline cache hit for %s (hits=%s, misses=%s)",
+            key,
+            self.hits,
+            self.misses,
+        )
+        dataframe: pd.DataFrame = self.manager.load(path, None)
+        with open(self._dtypes_path(key), encoding=settings.ENCODING) as file:
+            dtypes: list[str] = json.load(file)
+        return dataframe.astype(
+            {
+                column: dtype
+                for column, dtype in zip(dataframe.columns, dtypes)
+                if _dtype_name(dataframe[column].dtype) != dtype
+            }
+        )
+
+    def put(self, key: str, dataframe: pd.DataFrame) -> bool:
+        """
+        Store a dataframe in the cache and evict the least recently used
+         entries if the cache exceeds its maximum size.
+        :param key: The cache key
+        :type key: str
+        :param dataframe: The processed dataframe to cache
+        :type dataframe: pd.DataFrame
+        :return: True if the dataframe was cached; otherwise false.
+        :rtype: bool
+        """
+        path: str = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            stored: bool = self.manager.save(dataframe, None, path)
+            if stored:
+                with open(
+                    self._dtypes_path(key), "w", encoding=settings.ENCODING
+                ) as file:
+                    json.dump(
+                        [_dtype_name(dtype) for dtype in dataframe.dtypes], file
+                    )
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Pipeline cache could not store %s: %s", key, exc)
+            for leftover in (path, self._dtypes_path(key)):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+            return False
+        if stored:
+            self.evict()
+        return stored
+
+    def evict(self) -> int:
+        """
+        Remove the least recently used entries until the cache fits in
+         its maximum size.
+        :return: The number of evicted entries
+        :rtype: int
+        """
+        entries: list[os.DirEntry[str]] = sorted(
+            (
+                entry
+                for entry in os.scandir(self.directory)
+                if entry.name.endswith(".feather")
+            ),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        total_bytes: int = sum(entry.stat().st_size for entry in entries)
+        evicted: int = 0
+        for entry in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            total_bytes -= entry.stat().st_size
+            os.remove(entry.path)
+            dtypes_path: str = self._dtypes_path(entry.name[: -len(".feather")])
+            if os.path.exists(dtypes_path):
+                os.remove(dtypes_path)
+            evicted += 1
+        if evicted:
+            logger.info("Pipeline cache evicted %s entries", evicted)
+        return evicted
+
+
+pipeline_cache: PipelineCache = PipelineCache()
@@ -1,32 +1,104 @@
 """
 A module for data engineering in the engineering package.
 """
+import os
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 import pandas as pd
 
+from core.config import settings
+from core.decorators import profile
 from core.file_manager import DataType
-from engineering.extraction.extraction import extract_file
-from engineering.transformation.transformation import transform_data
+from core.persistence_manager import PersistenceManager
+from engineering.cache import pipeline_cache
+from engineering.extraction.extraction import extract_chunks, extract_file
+from engineering.transformation.pipeline import TransformationPipeline
+from engineering.transformation.transformation import build_pipeline
 
 
+@profile
 def et_pipeline(
-    filename: Union[str, Path], data_type: Optional[DataType] = DataType.RAW
+    filename: Union[str, Path],
+    data_type: Optional[DataType] = DataType.RAW,
+    use_cache: bool = settings.PIPELINE_CACHE_ENABLED,
+    stages: Optional[list[str]] = None,
+    optimize: bool = settings.OPTIMIZE_DTYPES,
 ) -> pd.DataFrame:
     """
     Execute the extraction and transformation (ET) pipeline.
     This pipeline first extracts raw data from the specified file and
-     then applies data transformation steps, including cleaning and
-      feature engineering.
+     then applies the configured transformation stages, by default
+      cleaning and feature engineering.
     :param filename: Filename or path to extract data from
     :type filename: Union[str, Path]
     :param data_type: The path where data will be saved.
     :type data_type: DataType
+    :param use_cache: Whether to reuse the processed result cached for
+     the same file content and transformation stages
+    :type use_cache: bool
+    :param stages: Names of the registered stages to apply. Defaults to
+     the TRANSFORMATION_STAGES setting
+    :type stages: Optional[list[str]]
+    :param optimize: Whether to downcast the dtypes of the result to
+     reduce its memory
+    :type optimize: bool
     :return: Transformed dataframe after applying extraction and
      transformation steps
     :rtype: pd.DataFrame
     """
+    pipeline: TransformationPipeline = build_pipeline(stages, optimize)
+    cache_key: Optional[str] = None
+    if use_cache:
+        filepath: str = (
+            os.path.join(data_type, filename) if data_type else str(filename)
+        )
+        cache_key = pipeline_cache.build_key(filepath, pipeline.functions)
+        cached_data: Optional[pd.DataFrame] = pipeline_cache.get(cache_key)
+        if cached_data is not None:
+            return cached_data
     raw_data: pd.DataFrame = extract_file(filename, data_type)
-    transformed_data: pd.DataFrame = transform_data(raw_data)
+    transformed_data: pd.DataFrame = pipeline.run(raw_data)
+    if cache_key:
+        pipeline_cache.put(cache_key, transformed_data)
     return transformed_data
+
+
+def et_pipeline_stream(
+    filename: Union[str, Path],
+    data_type: Optional[DataType] = DataType.RAW,
+    output_filename: str = "processed_data.csv",
+    chunk_size: int = settings.CHUNK_SIZE,
+    stages: Optional[list[str]] = None,
+) -> bool:
+    """
+    Execute the extraction and transformation (ET) pipeline in
+     streaming mode.
+    Raw data is extracted chunk by chunk, each chunk is transformed
+     independently and the processed output is written incrementally,
+      so memory usage is bounded by the chunk size instead of the file
+       size.
+    :param filename: Filename or path to extract data from
+    :type filename: Union[str, Path]
+    :param data_type: The path where data will be saved.
+    :type data_type: DataType
+    :param output_filename: Name of the processed file to write
+    :type output_filename: str
+    :param chunk_size: Maximum number of rows per chunk
+    :type chunk_size: int
+    :param stages: Names of the registered stages to apply. Defaults to
+     the TRANSFORMATION_STAGES setting
+    :type stages: Optional[list[str]]
+    :return: True if the processed file was created; otherwise false.
+    :rtype: bool
+    """
+    # Dtypes optimized per chunk could differ between chunks and break the
+    #  output schema, so chunks keep the extracted dtypes
+    pipeline: TransformationPipeline = build_pipeline(stages, False)
+    transformed_chunks: Iterator[pd.DataFrame] = (
+        pipeline.run(chunk)
+        for chunk in extract_chunks(filename, data_type, chunk_size)
+    )
+    return PersistenceManager.iter_save(
+        transformed_chunks, DataType.PROCESSED, output_filename
+    )
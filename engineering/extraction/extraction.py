@@ -1,14 +1,42 @@
 """
 A module for extraction in the engineering-extraction package.
 """
+import logging
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from pathlib import Path
-from typing import Optional, Union
+from time import perf_counter
+from typing import Iterable, Iterator, Optional, Union
 
+import numpy as np
 import pandas as pd
+from pydantic import BaseModel
 
+from core.config import settings
 from core.file_manager import DataType
 from core.persistence_manager import PersistenceManager
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Parsing these formats is CPU bound in Python, so they bypass the GIL
+#  in worker processes; the other formats release it and use threads
+PROCESS_EXTENSIONS: tuple[str, ...] = ("xlsx", "docx")
+
+
+class FileExtraction(BaseModel):
+    """
+    Timing of the extraction of a file
+    """
+
+    filename: str
+    rows: int
+    seconds: float
+    executor: str
+
 
 def extract_file(
     filename: Union[str, Path],
@@ -27,3 +55,173 @@ def extract_file(
         filename=filename, data_type=data_type
     )
     return dataframe
+
+
+def extract_chunks(
+    filename: Union[str, Path],
+    data_type: Optional[DataType] = None,
+    chunk_size: int = settings.CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Engineering method to lazily extract raw data from files in chunks
+    :param filename: Filename to extract data from
+    :type filename: Union[str, Path]
+    :param data_type: The path where data will be saved.
+    :type data_type: DataType
+    :param chunk_size: Maximum number of rows per chunk
+    :type chunk_size: int
+    :return: Iterator of dataframes with raw data
+    :rtype: Iterator[pd.DataFrame]
+    """
+    return PersistenceManager.iter_load(
+        filename=filename, data_type=data_type, chunk_size=chunk_size
+    )
+
+
+def _timed_load(
+    filename: Union[str, Path], data_type: Optional[DataType]
+) -> tuple[pd.DataFrame, float]:
+    """
+    Load a file and measure the time spent, inside a worker
+    :param filename: Filename to extract data from
+    :type filename: Union[str, Path]
+    :param data_type: The path where data will be saved.
+    :type data_type: DataType
+    :return: Dataframe with raw data and the seconds spent loading it
+    :rtype: tuple[pd.DataFrame, float]
+    """
+    start_time: float = perf_counter()
+    dataframe: pd.DataFrame = PersistenceManager.load(
+        filename=filename, data_type=data_type
+    )
+    return dataframe, perf_counter() - start_time
+
+
+def _resolve_files(
+    files: Union[str, Iterable[Union[str, Path]]],
+    data_type: Optional[DataType],
+) -> list[str]:
+    """
+    Expand a glob pattern, relative to the data type folder, or return
+     the given filenames
+    :param files: Glob pattern or filenames
+    :type files: Union[str, Iterable[Union[str, Path]]]
+    :param data_type: The path where data will be saved.
+    :type data_type: DataType
+    :return: The filenames, relative to the data type folder if any
+    :rtype: list[str]
+    """
+    if not isinstance(files, str):
+        return [str(filename) for filename in files]
+    folder: Path = Path(data_type.value if data_type else ".")
+    return sorted(
+        str(path.relative_to(folder))
+        for path in folder.glob(files)
+        if path.is_file()
+    )
+
+
+def _harmonize_dtypes(dataframes: list[pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    Cast the columns sharing a name to a common dtype before
+     concatenation: numeric columns to their common numeric type and
+      any other mismatch to object
+    :param dataframes: Dataframes extracted from each file
+    :type dataframes: list[pd.DataFrame]
+    :return: Dataframes with consistent dtypes
+    :rtype: list[pd.DataFrame]
+    """
+    dtypes: dict[str, set[np.dtype]] = {}
+    for dataframe in dataframes:
+        if dataframe.empty:
+            continue
+        for column, dtype in dataframe.dtypes.items():
+            dtypes.setdefault(column, set()).add(dtype)
+    common: dict[str, Union[np.dtype, str]] = {}
+    for column, column_dtypes in dtypes.items():
+        if len(column_dtypes) == 1:
+            common[column] = column_dtypes.pop()
+        elif all(pd.api.types.is_numeric_dtype(d) for d in column_dtypes):
+            common[column] = np.result_type(*column_dtypes)
+        else:
+            common[column] = "object"
+    return [
+        dataframe.astype(
+            {
+                column: dtype
+                for column, dtype in common.items()
+                if column in dataframe.columns
+                and dataframe[column].dtype != dtype
+            }
+        )
+        for dataframe in dataframes
+    ]
+
+
+def extract_many(
+    files: Union[str, Iterable[Union[str, Path]]],
+    data_type: Optional[DataType] = None,
+    workers: int = settings.EXTRACTION_WORKERS,
+) -> tuple[pd.DataFrame, list[FileExtraction]]:
+    """
+    Engineering method to extract raw data from many files concurrently.
+    Excel and Word files are parsed in a process pool and the other
+     formats in a thread pool; the results are concatenated in the
+      given order with consistent dtypes.
+    :param files: Glob pattern relative to the data type folder, e.g.
+     "*.csv", or filenames to extract data from
+    :type files: Union[str, Iterable[Union[str, Path]]]
+    :param data_type: The path where data will be saved.
+    :type data_type: DataType
+    :param workers: Maximum number of workers of each pool
+    :type workers: int
+    :return: Dataframe with the raw data of every file and the timing of
+     each file
+    :rtype: tuple[pd.DataFrame, list[FileExtraction]]
+    """
+    filenames: list[str] = _resolve_files(files, data_type)
+    if not filenames:
+        raise ValueError(f"No files found for {files}")
+    start_time: float = perf_counter()
+    futures: list[tuple[str, str, Future[tuple[pd.DataFrame, float]]]] = []
+    with ProcessPoolExecutor(workers) as processes, ThreadPoolExecutor(
+        workers
+    ) as threads:
+        for filename in filenames:
+            ext: str = filename.split('.')[-1]
+            executor: Executor = (
+                processes if ext in PROCESS_EXTENSIONS else threads
+            )
+            futures.append(
+                (
+                    filename,
+                    "process" if executor is processes else "thread",
+                    executor.submit(_timed_load, filename, data_type),
+                )
+            )
+        dataframes: list[pd.DataFrame] = []
+        extractions: list[FileExtraction] = []
+        for filename, executor_name, future in futures:
+            dataframe, seconds = future.result()
+            dataframes.append(dataframe)
+            extractions.append(
+                FileExtraction(
+                    filename=filename,
+                    rows=len(dataframe),
+                    seconds=seconds,
+                    executor=executor_name,
+                )
+            )
+    logger.info(
+        "Extracted %s files in %.3fs: %s",
+        len(filenames),
+        perf_counter() - start_time,
+        ", ".join(
+            f"{extraction.filename} {extraction.seconds:.3f}s"
+            for extraction in extractions
+        ),
+    )
+    return (
+        pd.concat(_harmonize_dtypes(dataframes), ignore_index=True),
+        extractions,
+    )
@@ -7,10 +7,9 @@ import pandas as pd
 def clean_data(dataframe: pd.DataFrame) -> pd.DataFrame:
     """
     Apply cleaning transformations to the dataframe.
-    :param dataframe: Input dataframe
+    :param dataframe: Input dataframe, left unchanged
     :type dataframe: pd.DataFrame
     :return: Cleaned dataframe
     :rtype: pd.DataFrame
     """
-    dataframe.dropna(inplace=True)
-    return dataframe
+    return dataframe.dropna()
@@ -7,10 +7,9 @@ import pandas as pd
 def engineer_features(dataframe: pd.DataFrame) -> pd.DataFrame:
     """
     Apply feature engineering transformations to the dataframe.
-    :param dataframe: Input dataframe
+    :param dataframe: Input dataframe, left unchanged
     :type dataframe: pd.DataFrame
     :return: Transformed dataframe with new features
     :rtype: pd.DataFrame
     """
-    dataframe['new_feature'] = dataframe['existing_feature'] * 2
-    return dataframe
+    return dataframe.assign(new_feature=dataframe['existing_feature'] * 2)
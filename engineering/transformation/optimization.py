@@ -0,0 +1,122 @@
+"""
+A module for memory optimization in the engineering-transformation
+ package.
+"""
+import logging
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from core.config import settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def _smallest_integer(series: pd.Series) -> Optional[str]:
+    """
+    Find the smallest integer dtype of the NUMERICS setting holding every
+     value of the series. Signed series stay signed so later arithmetic
+      cannot wrap around, and nullable or pyarrow-backed series keep
+       their backend so missing values are preserved
+    :param series: Integer series
+    :type series: pd.Series
+    :return: The dtype name or None if the series has no values
+    :rtype: Optional[str]
+    """
+    if not series.count():
+        return None
+    minimum: int = series.min()
+    maximum: int = series.max()
+    unsigned: bool = pd.api.types.is_unsigned_integer_dtype(series)
+    for dtype in settings.NUMERICS:
+        if not dtype.startswith("uint" if unsigned else "int"):
+            continue
+        info: np.iinfo = np.iinfo(dtype)
+        if info.min <= minimum and maximum <= info.max:
+            if isinstance(series.dtype, pd.ArrowDtype):
+                return f"{dtype}[pyarrow]"
+            if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+                return (
+                    f"U{dtype[1:].capitalize()}"
+                    if unsigned
+                    else dtype.capitalize()
+                )
+            return dtype
+    return None
+
+
+def _smallest_float(series: pd.Series) -> Optional[str]:
+    """
+    Find the smallest float dtype of the NUMERICS setting representing
+     every value of the series exactly
+    :param series: Float series
+    :type series: pd.Series
+    :return: The dtype name or None if no smaller dtype is exact
+    :rtype: Optional[str]
+    """
+    if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+        return None
+    values: np.ndarray = series.to_numpy()
+    for dtype in settings.NUMERICS:
+        if not dtype.startswith("float"):
+            continue
+        if np.dtype(dtype).itemsize >= values.dtype.itemsize:
+            return None
+        with np.errstate(over="ignore"):
+            if np.array_equal(
+                values.astype(dtype).astype(values.dtype),
+                values,
+                equal_nan=True,
+            ):
+                return dtype
+    return None
+
+
+def optimize_dtypes(
+    dataframe: pd.DataFrame,
+    category_ratio: float = settings.CATEGORY_MAX_RATIO,
+) -> pd.DataFrame:
+    """
+    Reduce the memory of the dataframe without losing information.
+    Integers and floats are downcast to the smallest dtype of the
+     NUMERICS setting that holds their values, object columns with few
+      distinct values become categories and the other text columns use
+       pyarrow-backed strings.
+    :param dataframe: Input dataframe, left unchanged
+    :type dataframe: pd.DataFrame
+    :param category_ratio: Maximum ratio of distinct values to rows for
+     an object column to become a category
+    :type category_ratio: float
+    :return: Dataframe with optimized dtypes
+    :rtype: pd.DataFrame
+    """
+    dtypes: dict[str, str] = {}
+    for column in dataframe.columns:
+        series: pd.Series = dataframe[column]
+        dtype: Optional[str] = None
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        if pd.api.types.is_integer_dtype(series):
+            dtype = _smallest_integer(series)
+        elif pd.api.types.is_float_dtype(series):
+            dtype = _smallest_float(series)
+        elif pd.api.types.is_object_dtype(series):
+            distinct: int = series.nunique(dropna=True)
+            if distinct <= category_ratio * len(series):
+                dtype = "category"
+            elif pd.api.types.infer_dtype(series, skipna=True) == "string":
+                dtype = "string[pyarrow]"
+        if dtype and dtype != series.dtype:
+            dtypes[column] = dtype
+    optimized: pd.DataFrame = dataframe.astype(dtypes)
+    before: int = int(dataframe.memory_usage(deep=True).sum())
+    after: int = int(optimized.memory_usage(deep=True).sum())
+    logger.info(
+        "Optimized dtypes of %s columns: %.2f MB -> %.2f MB (%.1fx smaller)",
+        len(dtypes),
+        before / 1024**2,
+        after / 1024**2,
+        before / after if after else 0.0,
+    )
+    return optimized
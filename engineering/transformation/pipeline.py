@@ -0,0 +1,196 @@
+"""
+A module for the transformation pipeline in the
+ engineering-transformation package.
+"""
+import logging
+from time import perf_counter
+from typing import Callable, Iterable, Optional
+
+import pandas as pd
+from pydantic import BaseModel
+
+from core.config import settings
+from core.metrics import metrics
+
+# Copy-on-write shares untouched columns between the stages and keeps
+#  the caller's dataframe isolated from later writes to the result
+pd.set_option("mode.copy_on_write", True)
+logger: logging.Logger = logging.getLogger(__name__)
+StageFunction = Callable[[pd.DataFrame], pd.DataFrame]
+
+
+class TransformationStage:
+    """
+    A named transformation with the columns it reads and writes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        function: StageFunction,
+        inputs: Iterable[str] = (),
+        outputs: Iterable[str] = (),
+    ):
+        """
+        Initialize the stage.
+        :param name: The name used to select the stage in the settings
+        :type name: str
+        :param function: Vectorized transformation returning a new
+         dataframe without mutating its input
+        :type function: StageFunction
+        :param inputs: Columns required by the stage
+        :type inputs: Iterable[str]
+        :param outputs: Columns created or replaced by the stage
+        :type outputs: Iterable[str]
+        """
+        self.name: str = name
+        self.function: StageFunction = function
+        self.inputs: tuple[str, ...] = tuple(inputs)
+        self.outputs: tuple[str, ...] = tuple(outputs)
+
+
+class StageReport(BaseModel):
+    """
+    Execution report of a transformation stage
+    """
+
+    stage: str
+    seconds: float
+    rows_in: int
+    rows_out: int
+    memory_delta_bytes: int
+
+
+STAGES: dict[str, TransformationStage] = {}
+
+
+def register_stage(
+    name: str,
+    function: StageFunction,
+    inputs: Iterable[str] = (),
+    outputs: Iterable[str] = (),
+) -> TransformationStage:
+    """
+    Register a transformation so pipelines can select it by name
+    :param name: The name of the stage
+    :type name: str
+    :param function: Vectorized transformation returning a new dataframe
+    :type function: StageFunction
+    :param inputs: Columns required by the stage
+    :type inputs: Iterable[str]
+    :param outputs: Columns created or replaced by the stage
+    :type outputs: Iterable[str]
+    :return: The registered stage
+    :rtype: TransformationStage
+    """
+    stage: TransformationStage = TransformationStage(
+        name, function, inputs, outputs
+    )
+    STAGES[name] = stage
+    return stage
+
+
+class TransformationPipeline:
+    """
+    Ordered chain of registered stages run under pandas copy-on-write,
+     so columns untouched by a stage are shared instead of copied and the
+      caller's dataframe is never modified.
+    """
+
+    def __init__(self, stage_names: Iterable[str]):
+        """
+        Initialize the pipeline from registered stage names.
+        :param stage_names: Names of the stages in execution order
+        :type stage_names: Iterable[str]
+        """
+        try:
+            self.stages: list[TransformationStage] = [
+                STAGES[name] for name in stage_names
+            ]
+        except KeyError as exc:
+            raise ValueError(f"Unknown transformation stage {exc}") from exc
+        self.reports: list[StageReport] = []
+
+    @property
+    def functions(self) -> list[StageFunction]:
+        """
+        Get the transformation functions of the stages
+        :return: The functions in execution order
+        :rtype: list[StageFunction]
+        """
+        return [stage.function for stage in self.stages]
+
+    def validate(self, columns: Iterable[str]) -> None:
+        """
+        Check that every stage finds its input columns, either in the
+         given columns or in the outputs of a previous stage.
+        :param columns: Columns of the input dataframe
+        :type columns: Iterable[str]
+        :return: None
+        :rtype: NoneType
+        """
+        available: set[str] = set(columns)
+        for stage in self.stages:
+            missing: set[str] = set(stage.inputs) - available
+            if missing:
+                raise ValueError(
+                    f"Stage {stage.name} is missing columns "
+                    f"{', '.join(sorted(missing))}"
+                )
+            available.update(stage.outputs)
+
+    def run(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the stages to the dataframe and record a report per stage.
+        :param dataframe: Input dataframe, left unchanged
+        :type dataframe: pd.DataFrame
+        :return: Transformed dataframe
+        :rtype: pd.DataFrame
+        """
+        self.validate(dataframe.columns)
+        self.reports = []
+        # A lazy copy, so even without stages the result is not the input
+        transformed_data: pd.DataFrame = dataframe.copy(deep=False)
+        # Deep accounting scans every object value, so it is only done
+        #  when memory is tracked
+        deep: bool = settings.METRICS_TRACK_MEMORY
+        for stage in self.stages:
+            memory_before: int = int(
+                transformed_data.memory_usage(index=True, deep=deep).sum()
+            )
+            rows_in: int = len(transformed_data)
+            start_time: float = perf_counter()
+            transformed_data = stage.function(transformed_data)
+            report: StageReport = StageReport(
+                stage=stage.name,
+                seconds=perf_counter() - start_time,
+                rows_in=rows_in,
+                rows_out=len(transformed_data),
+                memory_delta_bytes=int(
+                    transformed_data.memory_usage(index=True, deep=deep).sum()
+                )
+                - memory_before,
+            )
+            logger.info(
+                "Stage %s took %.4fs, %s -> %s rows, %+d bytes",
+                report.stage,
+                report.seconds,
+                report.rows_in,
+                report.rows_out,
+                report.memory_delta_bytes,
+            )
+            metrics.observe(
+                "stage_duration_seconds", stage.name, report.seconds
+            )
+            self.reports.append(report)
+        return transformed_data
+
+    def report(self) -> Optional[pd.DataFrame]:
+        """
+        Get the reports of the last run as a dataframe
+        :return: One row per stage or None if the pipeline has not run
+        :rtype: Optional[pd.DataFrame]
+        """
+        if not self.reports:
+            return None
+        return pd.DataFrame([report.dict() for report in self.reports])
@@ -1,21 +1,64 @@
 """
 A module for data transformation in the engineering-transformation package.
 """
+from typing import Iterable, Optional
+
 import pandas as pd
 
+from core.config import settings
 from engineering.transformation.cleaning import clean_data
 from engineering.transformation.feature_engineering import engineer_features
+from engineering.transformation.optimization import optimize_dtypes
+from engineering.transformation.pipeline import (
+    TransformationPipeline,
+    register_stage,
+)
+
+register_stage("clean_data", clean_data)
+register_stage(
+    "engineer_features",
+    engineer_features,
+    inputs=("existing_feature",),
+    outputs=("new_feature",),
+)
+register_stage("optimize_dtypes", optimize_dtypes)
+
+
+def build_pipeline(
+    stages: Optional[Iterable[str]] = None,
+    optimize: bool = settings.OPTIMIZE_DTYPES,
+) -> TransformationPipeline:
+    """
+    Build a transformation pipeline from registered stage names
+    :param stages: Names of the registered stages to apply. Defaults to
+     the TRANSFORMATION_STAGES setting
+    :type stages: Optional[Iterable[str]]
+    :param optimize: Whether to finish with the optimize_dtypes stage
+     if it is not already part of the stages
+    :type optimize: bool
+    :return: The transformation pipeline
+    :rtype: TransformationPipeline
+    """
+    stage_names: list[str] = list(
+        settings.TRANSFORMATION_STAGES if stages is None else stages
+    )
+    if optimize and "optimize_dtypes" not in stage_names:
+        stage_names.append("optimize_dtypes")
+    return TransformationPipeline(stage_names)
 
 
-def transform_data(dataframe: pd.DataFrame) -> pd.DataFrame:
+def transform_data(
+    dataframe: pd.DataFrame, stages: Optional[Iterable[str]] = None
+) -> pd.DataFrame:
     """
-    Apply both cleaning and feature engineering transformations to the
-     dataframe.
-    :param dataframe: Input dataframe
+    Apply the configured transformation stages to the dataframe, by
+     default cleaning and feature engineering.
+    :param dataframe: Input dataframe, left unchanged
     :type dataframe: pd.DataFrame
+    :param stages: Names of the registered stages to apply. Defaults to
+     the TRANSFORMATION_STAGES setting
+    :type stages: Optional[Iterable[str]]
     :return: Transformed dataframe
     :rtype: pd.DataFrame
     """
-    cleaned_data: pd.DataFrame = clean_data(dataframe)
-    transformed_data: pd.DataFrame = engineer_features(cleaned_data)
-    return transformed_data
+    return build_pipeline(stages).run(dataframe)
@@ -1,14 +1,14 @@
 """
 A module for autochain config in the models package.
 """
+from typing import TYPE_CHECKING
 
-import torch
-from autochain.chain.chain import Chain
-from sklearn.metrics import accuracy_score
-from torch import Tensor
-from transformers import BatchEncoding
+from core.decorators import profile
 
-from models.bert_agent import BertAgent
+if TYPE_CHECKING:
+    from torch import Tensor
+
+    from models.bert_agent import BertAgent
 
 
 class AutoChainConfig:
@@ -20,15 +20,20 @@ class AutoChainConfig:
         """
         Initialize the AutoChainConfig.
         """
+        from autochain.chain.chain import Chain
+
+        from models.bert_agent import BertAgent
+
         self.autochain = Chain()
-        self.bert_agent = BertAgent(model_name)
+        self.bert_agent: "BertAgent" = BertAgent(model_name)
 
+    @profile
     def train(
         self,
         x_train: list[str],
-        y_train: Tensor,
+        y_train: "Tensor",
         x_test: list[str],
-        y_test: Tensor,
+        y_test: "Tensor",
     ) -> float:
         """
         Train AutoChain with the given data and evaluate on the test set.
@@ -43,16 +48,9 @@ class AutoChainConfig:
         :return: Accuracy score on the test set
         :rtype: float
         """
-        train_inputs: list[BatchEncoding] = [
-            self.bert_agent.tokenize(text) for text in x_train
-        ]
-        test_inputs: list[BatchEncoding] = [
-            self.bert_agent.tokenize(text) for text in x_test
-        ]
-        for inputs, labels in zip(train_inputs, y_train):
-            self.bert_agent.train(inputs, labels)
-        y_pred_logits: list[Tensor] = [
-            self.bert_agent.predict(inputs.data) for inputs in test_inputs
-        ]
-        y_pred: Tensor = torch.argmax(torch.cat(y_pred_logits), dim=1)
+        from sklearn.metrics import accuracy_score
+
+        self.bert_agent.fit(self.bert_agent.build_dataset(x_train, y_train))
+        y_pred_logits: "Tensor" = self.bert_agent.predict_batch(x_test)
+        y_pred: "Tensor" = y_pred_logits.argmax(dim=1)
         return float(accuracy_score(y_test, y_pred.cpu().numpy()))
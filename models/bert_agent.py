@@ -1,32 +1,103 @@
 """
 A module for bert agent in the models package.
 """
-from typing import Any
+import copy
+import logging
+from typing import Any, Iterator, Optional, Sequence
 
 import torch
 from torch import Tensor
+from torch.optim import AdamW
+from torch.utils.data import DataLoader
 from transformers import (
     BatchEncoding,
     BertForSequenceClassification,
-    BertTokenizer,
+    BertTokenizerFast,
+    DataCollatorWithPadding,
+    get_linear_schedule_with_warmup,
 )
 
+from core.config import settings
+from models.dataset import EncodedDataset
+from models.registry import ModelRegistry
+
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 class BertAgent:
     """
     BertAgent class for handling BERT related functions.
     """
 
-    def __init__(self, model_name: str = "bert-base-uncased"):
+    def __init__(
+        self,
+        model_name: str = "bert-base-uncased",
+        quantize: bool = settings.QUANTIZED_INFERENCE,
+        num_threads: Optional[int] = settings.TORCH_NUM_THREADS,
+        shared: bool = True,
+    ):
         """
         Initialize the BertAgent with specific model name.
         :param model_name: Name of the BERT model to use
         :type model_name: str
+        :param quantize: Whether to use dynamic int8 quantization for
+         CPU inference
+        :type quantize: bool
+        :param num_threads: Number of threads used by torch for
+         intra-op parallelism. Defaults to torch's own choice
+        :type num_threads: Optional[int]
+        :param shared: Whether to use the read-only weights shared
+         through the model registry. Shared weights are copied before
+          training
+        :type shared: bool
         """
-        self.tokenizer: BertTokenizer = BertTokenizer.from_pretrained(
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        self.model_name: str = model_name
+        self.tokenizer: BertTokenizerFast = ModelRegistry.get_tokenizer(
             model_name
         )
-        self.model = BertForSequenceClassification.from_pretrained(model_name)
+        self.shared: bool = shared
+        self.model: BertForSequenceClassification = (
+            ModelRegistry.get_model(model_name)
+            if shared
+            else BertForSequenceClassification.from_pretrained(model_name)
+        )
+        self.quantized: bool = False
+        if quantize:
+            self.quantize()
+
+    def quantize(self) -> None:
+        """
+        Applies dynamic int8 quantization to the Linear layers of the
+         model for faster, lighter CPU inference. The quantized model
+          can no longer be trained.
+        :return: None
+        :rtype: NoneType
+        """
+        if self.quantized:
+            return
+        if self.shared:
+            self.model = ModelRegistry.get_model(self.model_name, "qint8")
+        else:
+            self.model.eval()
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        self.quantized = True
+
+    def _own_model(self) -> None:
+        """
+        Replaces the shared read-only model with a private trainable
+         copy so fine-tuning never changes other agents' weights.
+        :return: None
+        :rtype: NoneType
+        """
+        if not self.shared:
+            return
+        self.model = copy.deepcopy(self.model)
+        self.model.requires_grad_(True)
+        self.shared = False
 
     def tokenize(self, text: str) -> BatchEncoding:
         """
@@ -40,17 +111,199 @@ class BertAgent:
             text, padding=True, truncation=True, return_tensors="pt"
         )
 
-    def train(self, inputs: dict[str, Any], labels: Tensor) -> None:
+    def tokenize_batch(
+        self,
+        texts: Sequence[str],
+        batch_size: int = settings.BATCH_SIZE,
+        max_length: int = settings.MAX_SEQUENCE_LENGTH,
+        bucket_by_length: bool = False,
+    ) -> Iterator[tuple[list[int], BatchEncoding]]:
+        """
+        Tokenizes the given texts in batches using the fast BERT
+         tokenizer, padding each batch only to its longest sequence.
+        :param texts: Texts to be tokenized
+        :type texts: Sequence[str]
+        :param batch_size: Number of texts per batch
+        :type batch_size: int
+        :param max_length: Maximum number of tokens per sequence
+        :type max_length: int
+        :param bucket_by_length: Whether to group texts of similar token
+         length in the same batch to reduce padding
+        :type bucket_by_length: bool
+        :return: Iterator of the positions of the texts in each batch
+         and their padded tokenized tensors
+        :rtype: Iterator[tuple[list[int], BatchEncoding]]
+        """
+        if bucket_by_length:
+            yield from self._tokenize_buckets(texts, batch_size, max_length)
+            return
+        for start in range(0, len(texts), batch_size):
+            indices: list[int] = list(
+                range(start, min(start + batch_size, len(texts)))
+            )
+            yield indices, self.tokenizer(
+                [texts[i] for i in indices],
+                padding=True,
+                truncation=True,
+                max_length=max_length,
+                return_tensors="pt",
+            )
+
+    def _tokenize_buckets(
+        self, texts: Sequence[str], batch_size: int, max_length: int
+    ) -> Iterator[tuple[list[int], BatchEncoding]]:
+        """
+        Tokenizes all texts once, sorts them by token length and pads
+         each batch of similar length sequences.
+        :param texts: Texts to be tokenized
+        :type texts: Sequence[str]
+        :param batch_size: Number of texts per batch
+        :type batch_size: int
+        :param max_length: Maximum number of tokens per sequence
+        :type max_length: int
+        :return: Iterator of the positions of the texts in each batch
+         and their padded tokenized tensors
+        :rtype: Iterator[tuple[list[int], BatchEncoding]]
+        """
+        encodings: BatchEncoding = self.tokenizer(
+            list(texts), truncation=True, max_length=max_length
+        )
+        order: list[int] = sorted(
+            range(len(texts)), key=lambda i: len(encodings["input_ids"][i])
+        )
+        for start in range(0, len(order), batch_size):
+            indices: list[int] = order[start : start + batch_size]
+            yield indices, self.tokenizer.pad(
+                {
+                    key: [values[i] for i in indices]
+                    for key, values in encodings.items()
+                },
+                return_tensors="pt",
+            )
+
+    def build_dataset(
+        self,
+        texts: Sequence[str],
+        labels: Tensor,
+        max_length: int = settings.MAX_SEQUENCE_LENGTH,
+    ) -> EncodedDataset:
         """
-        Trains the BERT model with given inputs and labels.
+        Tokenizes all texts in one batched call, without padding, and
+         wraps them with their labels in a dataset.
+        :param texts: Texts to be tokenized
+        :type texts: Sequence[str]
+        :param labels: Labels for each text
+        :type labels: Tensor
+        :param max_length: Maximum number of tokens per sequence
+        :type max_length: int
+        :return: The dataset of tokenized texts and labels
+        :rtype: EncodedDataset
+        """
+        encodings: BatchEncoding = self.tokenizer(
+            list(texts), truncation=True, max_length=max_length
+        )
+        return EncodedDataset(encodings, labels)
+
+    def train(
+        self,
+        inputs: dict[str, Any],
+        labels: Tensor,
+        accumulation_steps: int = 1,
+    ) -> float:
+        """
+        Computes the loss of a mini-batch and back-propagates it. The
+         optimizer step is left to the caller, so gradients of several
+          mini-batches can be accumulated.
         :param inputs: Input data for training
         :type inputs: dict[str, Any]
         :param labels: Labels for training
         :type labels: Tensor
+        :param accumulation_steps: Number of mini-batches accumulated
+         before each optimizer step, used to scale the loss
+        :type accumulation_steps: int
+        :return: The unscaled loss of the mini-batch
+        :rtype: float
         """
+        if self.quantized:
+            raise RuntimeError("A quantized model cannot be trained")
+        self._own_model()
         outputs = self.model(**inputs, labels=labels)
-        loss = outputs.loss
-        loss.backward()
+        loss: Tensor = outputs.loss
+        (loss / accumulation_steps).backward()
+        return float(loss.item())
+
+    def fit(
+        self,
+        dataset: EncodedDataset,
+        epochs: int = settings.EPOCHS,
+        batch_size: int = settings.BATCH_SIZE,
+        learning_rate: float = settings.LEARNING_RATE,
+        accumulation_steps: int = settings.GRADIENT_ACCUMULATION_STEPS,
+        warmup_ratio: float = settings.WARMUP_RATIO,
+    ) -> list[float]:
+        """
+        Fine-tunes the BERT model on the dataset with shuffled,
+         dynamically padded mini-batches, an AdamW optimizer, a linear
+          warmup scheduler and gradient accumulation.
+        :param dataset: The dataset of tokenized texts and labels
+        :type dataset: EncodedDataset
+        :param epochs: Number of passes over the dataset
+        :type epochs: int
+        :param batch_size: Number of examples per mini-batch
+        :type batch_size: int
+        :param learning_rate: Peak learning rate of the optimizer
+        :type learning_rate: float
+        :param accumulation_steps: Number of mini-batches accumulated
+         before each optimizer step
+        :type accumulation_steps: int
+        :param warmup_ratio: Fraction of optimizer steps used to warm up
+         the learning rate
+        :type warmup_ratio: float
+        :return: The mean training loss of each epoch
+        :rtype: list[float]
+        """
+        if self.quantized:
+            raise RuntimeError("A quantized model cannot be trained")
+        self._own_model()
+        loader: DataLoader[dict[str, Tensor]] = DataLoader(
+            dataset,
+            batch_size=batch_size,
+            shuffle=True,
+            collate_fn=DataCollatorWithPadding(self.tokenizer),
+            num_workers=settings.DATALOADER_WORKERS,
+        )
+        optimizer: AdamW = AdamW(
+            self.model.parameters(),
+            lr=learning_rate,
+            weight_decay=settings.WEIGHT_DECAY,
+        )
+        total_steps: int = max(
+            1, -(-len(loader) // accumulation_steps) * epochs
+        )
+        scheduler = get_linear_schedule_with_warmup(
+            optimizer, int(total_steps * warmup_ratio), total_steps
+        )
+        self.model.train()
+        epoch_losses: list[float] = []
+        for epoch in range(epochs):
+            running_loss: float = 0.0
+            optimizer.zero_grad()
+            for step, batch in enumerate(loader, start=1):
+                labels: Tensor = batch.pop("labels")
+                running_loss += self.train(batch, labels, accumulation_steps)
+                if step % accumulation_steps == 0 or step == len(loader):
+                    optimizer.step()
+                    scheduler.step()
+                    optimizer.zero_grad()
+            epoch_losses.append(running_loss / max(1, len(loader)))
+            logger.info(
+                "Epoch %s/%s finished with mean loss %.4f",
+                epoch + 1,
+                epochs,
+                epoch_losses[-1],
+            )
+        self.model.eval()
+        return epoch_losses
 
     def predict(self, inputs: dict[str, Any]) -> Tensor:
         """
@@ -60,5 +313,40 @@ class BertAgent:
         :return: Predicted outputs
         :rtype: Tensor
         """
-        with torch.no_grad():
-            return Tensor(self.model(**inputs).logits)
+        self.model.eval()
+        with torch.inference_mode():
+            logits: Tensor = self.model(**inputs).logits
+        return logits
+
+    def predict_batch(
+        self,
+        texts: Sequence[str],
+        batch_size: int = settings.BATCH_SIZE,
+        max_length: int = settings.MAX_SEQUENCE_LENGTH,
+    ) -> Tensor:
+        """
+        Predicts the logits of many texts, streaming length-bucketed
+         batches through the model in evaluation mode and writing each
+          batch into a single preallocated output tensor.
+        :param texts: Texts to predict
+        :type texts: Sequence[str]
+        :param batch_size: Number of texts per forward pass
+        :type batch_size: int
+        :param max_length: Maximum number of tokens per sequence
+        :type max_length: int
+        :return: Logits of shape (number of texts, number of labels) in
+         the same order as the texts
+        :rtype: Tensor
+        """
+        if not texts:
+            return torch.empty((0, self.model.config.num_labels))
+        self.model.eval()
+        with torch.inference_mode():
+            logits: Tensor = torch.empty(
+                (len(texts), self.model.config.num_labels)
+            )
+            for indices, inputs in self.tokenize_batch(
+                texts, batch_size, max_length, bucket_by_length=True
+            ):
+                logits[indices] = self.model(**inputs).logits
+        return logits
@@ -0,0 +1,52 @@
+"""
+A module for datasets in the models package.
+"""
+from typing import Any
+
+import torch
+from torch import Tensor
+from torch.utils.data import Dataset
+from transformers import BatchEncoding
+
+
+class EncodedDataset(Dataset[dict[str, Tensor]]):
+    """
+    Dataset of tokenized texts and their labels. Sequences are kept
+     unpadded so each mini-batch is padded only to its longest sequence
+      by the collator.
+    """
+
+    def __init__(self, encodings: BatchEncoding, labels: Tensor):
+        """
+        Initialize the dataset with tokenized texts and labels.
+        :param encodings: Unpadded tokenized texts
+        :type encodings: BatchEncoding
+        :param labels: Labels for each text
+        :type labels: Tensor
+        """
+        if len(encodings["input_ids"]) != len(labels):
+            raise ValueError("Encodings and labels must have the same length")
+        self.encodings: BatchEncoding = encodings
+        self.labels: Tensor = torch.as_tensor(labels)
+
+    def __len__(self) -> int:
+        """
+        Get the number of examples in the dataset.
+        :return: The number of examples
+        :rtype: int
+        """
+        return len(self.labels)
+
+    def __getitem__(self, index: int) -> dict[str, Any]:
+        """
+        Get the tokenized example and label at the given index.
+        :param index: Position of the example
+        :type index: int
+        :return: The tokenized example including its label
+        :rtype: dict[str, Any]
+        """
+        item: dict[str, Any] = {
+            key: values[index] for key, values in self.encodings.items()
+        }
+        item["labels"] = self.labels[index]
+        return item
@@ -0,0 +1,120 @@
+"""
+A module for quantization benchmarking in the models package.
+"""
+import copy
+import io
+import logging
+from statistics import median
+from time import perf_counter
+from typing import Sequence
+
+import torch
+from pydantic import BaseModel
+from sklearn.metrics import accuracy_score
+from torch import Tensor
+
+from core.config import settings
+from models.bert_agent import BertAgent
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class QuantizationReport(BaseModel):
+    """
+    Accuracy, latency and size measurements of a model variant
+    """
+
+    variant: str
+    accuracy: float
+    agreement: float
+    latency_ms_per_text: float
+    size_mb: float
+
+
+def model_size_mb(model: torch.nn.Module) -> float:
+    """
+    Compute the serialized size of a model's state dict
+    :param model: The model to measure
+    :type model: torch.nn.Module
+    :return: The size of the model in megabytes
+    :rtype: float
+    """
+    buffer: io.BytesIO = io.BytesIO()
+    torch.save(model.state_dict(), buffer)
+    return buffer.getbuffer().nbytes / 1024**2
+
+
+def _measure(
+    agent: BertAgent, texts: Sequence[str], batch_size: int, repeats: int
+) -> tuple[Tensor, float]:
+    """
+    Predict the texts several times and keep the median latency
+    :param agent: The agent to measure
+    :type agent: BertAgent
+    :param texts: Texts to predict
+    :type texts: Sequence[str]
+    :param batch_size: Number of texts per forward pass
+    :type batch_size: int
+    :param repeats: Number of timed runs
+    :type repeats: int
+    :return: The predicted labels and the median latency per text in
+     milliseconds
+    :rtype: tuple[Tensor, float]
+    """
+    agent.predict_batch(texts[:batch_size], batch_size)
+    timings: list[float] = []
+    predictions: Tensor = torch.empty(0)
+    for _ in range(repeats):
+        start_time: float = perf_counter()
+        predictions = torch.argmax(agent.predict_batch(texts, batch_size), 1)
+        timings.append(perf_counter() - start_time)
+    return predictions, median(timings) * 1000 / max(1, len(texts))
+
+
+def compare_quantization(
+    agent: BertAgent,
+    texts: Sequence[str],
+    labels: Tensor,
+    batch_size: int = settings.BATCH_SIZE,
+    repeats: int = 3,
+) -> dict[str, QuantizationReport]:
+    """
+    Compare the accuracy, latency and size of the fp32 model against
+     its dynamically int8 quantized copy on the same hardware
+    :param agent: An agent holding the fp32 model
+    :type agent: BertAgent
+    :param texts: Evaluation texts
+    :type texts: Sequence[str]
+    :param labels: Evaluation labels
+    :type labels: Tensor
+    :param batch_size: Number of texts per forward pass
+    :type batch_size: int
+    :param repeats: Number of timed runs per variant
+    :type repeats: int
+    :return: The report of each variant keyed by its name
+    :rtype: dict[str, QuantizationReport]
+    """
+    quantized_agent: BertAgent = copy.copy(agent)
+    quantized_agent.model = copy.deepcopy(agent.model)
+    quantized_agent.shared = False
+    quantized_agent.quantize()
+    fp32_predictions, fp32_latency = _measure(agent, texts, batch_size, repeats)
+    int8_predictions, int8_latency = _measure(
+        quantized_agent, texts, batch_size, repeats
+    )
+    reports: dict[str, QuantizationReport] = {}
+    for variant, model, predictions, latency in (
+        ("fp32", agent.model, fp32_predictions, fp32_latency),
+        ("int8", quantized_agent.model, int8_predictions, int8_latency),
+    ):
+        reports[variant] = QuantizationReport(
+            variant=variant,
+            accuracy=float(accuracy_score(labels, predictions.numpy())),
+            agreement=float(
+                (predictions == fp32_predictions).float().mean().item()
+            ),
+            latency_ms_per_text=latency,
+            size_mb=model_size_mb(model),
+        )
+        logger.info("Quantization report: %s", reports[variant])
+    return reports
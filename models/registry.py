@@ -0,0 +1,129 @@
+"""
+A module for the shared model registry in the models package.
+"""
+import logging
+import threading
+from typing import Iterable
+
+import torch
+from transformers import BertForSequenceClassification, BertTokenizerFast
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DTYPES: dict[str, torch.dtype] = {
+    "float32": torch.float32,
+    "float16": torch.float16,
+    "bfloat16": torch.bfloat16,
+    "qint8": torch.qint8,
+}
+
+
+class ModelRegistry:
+    """
+    Process-wide registry that loads each tokenizer and model once and
+     shares their read-only weights between agents.
+    """
+
+    _tokenizers: dict[str, BertTokenizerFast] = {}
+    _models: dict[tuple[str, str], BertForSequenceClassification] = {}
+    _lock: threading.RLock = threading.RLock()
+
+    @classmethod
+    def get_tokenizer(cls, model_name: str) -> BertTokenizerFast:
+        """
+        Get the shared fast tokenizer of a model, loading it on first use.
+        :param model_name: Name or path of the pretrained model
+        :type model_name: str
+        :return: The shared tokenizer
+        :rtype: BertTokenizerFast
+        """
+        with cls._lock:
+            if model_name not in cls._tokenizers:
+                logger.info("Loading tokenizer %s", model_name)
+                cls._tokenizers[model_name] = BertTokenizerFast.from_pretrained(
+                    model_name
+                )
+            return cls._tokenizers[model_name]
+
+    @classmethod
+    def get_model(
+        cls, model_name: str, dtype: str = "float32"
+    ) -> BertForSequenceClassification:
+        """
+        Get the shared model for a name and dtype, loading it on first
+         use. Shared models are in evaluation mode with gradients
+          disabled and must not be modified in place.
+        :param model_name: Name or path of the pretrained model
+        :type model_name: str
+        :param dtype: One of float32, float16, bfloat16 or qint8 for
+         dynamically quantized Linear layers
+        :type dtype: str
+        :return: The shared model
+        :rtype: BertForSequenceClassification
+        """
+        if dtype not in DTYPES:
+            raise ValueError(f"Unsupported model dtype {dtype}")
+        key: tuple[str, str] = (model_name, dtype)
+        with cls._lock:
+            if key not in cls._models:
+                cls._models[key] = cls._load(model_name, dtype)
+            return cls._models[key]
+
+    @classmethod
+    def _load(
+        cls, model_name: str, dtype: str
+    ) -> BertForSequenceClassification:
+        """
+        Load a model and convert it to the requested dtype.
+        :param model_name: Name or path of the pretrained model
+        :type model_name: str
+        :param dtype: The dtype key of the model
+        :type dtype: str
+        :return: The loaded read-only model
+        :rtype: BertForSequenceClassification
+        """
+        if dtype == "qint8":
+            model = torch.ao.quantization.quantize_dynamic(
+                cls.get_model(model_name, "float32"),
+                {torch.nn.Linear},
+                dtype=torch.qint8,
+            )
+        else:
+            logger.info("Loading model %s as %s", model_name, dtype)
+            model = BertForSequenceClassification.from_pretrained(
+                model_name, torch_dtype=DTYPES[dtype]
+            )
+        model.eval()
+        model.requires_grad_(False)
+        return model
+
+    @classmethod
+    def preload(
+        cls, model_names: Iterable[str], dtypes: Iterable[str] = ("float32",)
+    ) -> None:
+        """
+        Load models and tokenizers up front, e.g. in a parent process
+         before forking workers so they share the weights copy-on-write.
+        :param model_names: Names or paths of the pretrained models
+        :type model_names: Iterable[str]
+        :param dtypes: The dtypes to load for every model
+        :type dtypes: Iterable[str]
+        :return: None
+        :rtype: NoneType
+        """
+        dtypes = tuple(dtypes)
+        for model_name in model_names:
+            cls.get_tokenizer(model_name)
+            for dtype in dtypes:
+                cls.get_model(model_name, dtype)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Release every registered model and tokenizer.
+        :return: None
+        :rtype: NoneType
+        """
+        with cls._lock:
+            cls._tokenizers.clear()
+            cls._models.clear()
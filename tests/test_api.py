@@ -0,0 +1,91 @@
+"""
+Tests for the inference server and the load generator.
+"""
+import asyncio
+import json
+import math
+from typing import Any
+
+import pytest
+from aiohttp import web
+from starlette.requests import Request
+
+from api.app import app, predict
+from api.load_generator import generate_load
+
+
+class _EchoBatcher:
+    async def submit(self, texts: list[str]) -> list[list[float]]:
+        return [[0.0, float(len(text))] for text in texts]
+
+
+def _post(body: bytes) -> tuple[int, dict[str, Any]]:
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope: dict[str, Any] = {
+        "type": "http",
+        "method": "POST",
+        "path": "/predict",
+        "headers": [(b"content-type", b"application/json")],
+        "app": app,
+    }
+    app.state.batcher = _EchoBatcher()
+    response = asyncio.run(predict(Request(scope, receive)))
+    return response.status_code, json.loads(response.body)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"texts": "hello"}',
+        b'{"texts": []}',
+        b'{"texts": ["hello", 1]}',
+        b'{"text": 1}',
+        b"{}",
+        b"[1]",
+        b'"hello"',
+        b"{not json",
+        b"",
+    ],
+)
+def test_predict_rejects_invalid_bodies(body: bytes) -> None:
+    status_code, _ = _post(body)
+    assert status_code == 422
+
+
+@pytest.mark.parametrize(
+    "body, count",
+    [(b'{"text": "hello"}', 1), (b'{"texts": ["hello", "hi"]}', 2)],
+)
+def test_predict_accepts_texts(body: bytes, count: int) -> None:
+    status_code, content = _post(body)
+    assert status_code == 200
+    assert len(content["predictions"]) == count
+    assert content["predictions"][0]["label"] == 1
+
+
+async def _load(requests: int) -> dict[str, float]:
+    async def handle(request: web.Request) -> web.Response:
+        return web.json_response({"predictions": []})
+
+    server: web.Application = web.Application()
+    server.router.add_post("/predict", handle)
+    runner: web.AppRunner = web.AppRunner(server)
+    await runner.setup()
+    site: web.TCPSite = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port: int = runner.addresses[0][1]
+    try:
+        return await generate_load(
+            f"http://127.0.0.1:{port}/predict", 1, requests, "hello"
+        )
+    finally:
+        await runner.cleanup()
+
+
+def test_generate_load_with_fewer_than_two_requests() -> None:
+    assert math.isnan(asyncio.run(_load(0))["p50_ms"])
+    results: dict[str, float] = asyncio.run(_load(1))
+    assert results["ok"] == 1
+    assert results["p50_ms"] == results["p99_ms"] > 0
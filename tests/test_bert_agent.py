@@ -0,0 +1,58 @@
+"""
+Tests for the BERT agent.
+"""
+from pathlib import Path
+
+import pytest
+import torch
+from transformers import (
+    BertConfig,
+    BertForSequenceClassification,
+    BertTokenizerFast,
+)
+
+from models.bert_agent import BertAgent
+
+
+@pytest.fixture(scope="module")
+def tiny_model(tmp_path_factory: pytest.TempPathFactory) -> str:
+    directory: Path = tmp_path_factory.mktemp("tiny_bert")
+    tokens: list[str] = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"] + [
+        "reset",
+        "my",
+        "password",
+        "please",
+    ]
+    vocab_file: Path = directory / "vocab.txt"
+    vocab_file.write_text("\n".join(tokens), encoding="utf-8")
+    BertTokenizerFast(str(vocab_file), model_max_length=32).save_pretrained(
+        directory
+    )
+    torch.manual_seed(0)
+    BertForSequenceClassification(
+        BertConfig(
+            vocab_size=len(tokens),
+            hidden_size=16,
+            num_hidden_layers=1,
+            num_attention_heads=2,
+            intermediate_size=32,
+            max_position_embeddings=32,
+            num_labels=3,
+        )
+    ).save_pretrained(directory)
+    return str(directory)
+
+
+def test_predict_batch_without_texts(tiny_model: str) -> None:
+    agent: BertAgent = BertAgent(tiny_model)
+    assert agent.predict_batch([]).shape == (0, 3)
+    assert agent.predict_batch(["reset my password"]).shape == (1, 3)
+
+
+def test_quantized_model_cannot_be_trained(tiny_model: str) -> None:
+    agent: BertAgent = BertAgent(tiny_model, quantize=True)
+    inputs = agent.tokenize("reset my password")
+    with pytest.raises(RuntimeError):
+        agent.train(inputs, torch.tensor([1]))
+    with pytest.raises(RuntimeError):
+        agent.fit(agent.build_dataset(["reset my password"], [1]))
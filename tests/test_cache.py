@@ -0,0 +1,72 @@
+"""
+Tests for the pipeline cache.
+"""
+import functools
+from pathlib import Path
+
+import pandas as pd
+
+from core.config import settings
+from engineering.cache import PipelineCache, fingerprint_steps
+
+
+def _scale(dataframe: pd.DataFrame, factor: int = 2) -> pd.DataFrame:
+    return dataframe * factor * settings.CHUNK_SIZE
+
+
+def _cache(directory: Path) -> PipelineCache:
+    cache: PipelineCache = PipelineCache()
+    cache.directory = str(directory)
+    return cache
+
+
+def test_fingerprint_is_stable() -> None:
+    assert fingerprint_steps([_scale]) == fingerprint_steps([_scale])
+
+
+def test_fingerprint_changes_with_step_arguments() -> None:
+    fingerprints: set[str] = {
+        fingerprint_steps([_scale]),
+        fingerprint_steps([functools.partial(_scale, **{})]),
+        fingerprint_steps([functools.partial(_scale, factor=3)]),
+        fingerprint_steps([functools.partial(_scale, factor=4)]),
+    }
+    assert len(fingerprints) == 3
+
+
+def test_fingerprint_changes_with_settings_read_by_steps(
+    monkeypatch,
+) -> None:
+    before: str = fingerprint_steps([_scale])
+    monkeypatch.setattr(settings, "CHUNK_SIZE", 7)
+    assert fingerprint_steps([_scale]) != before
+    monkeypatch.undo()
+    monkeypatch.setattr(settings, "ENCODING", "latin-1")
+    assert fingerprint_steps([_scale]) == before
+
+
+def test_cache_hit_keeps_dtypes(tmp_path: Path) -> None:
+    cache: PipelineCache = _cache(tmp_path)
+    dataframe: pd.DataFrame = pd.DataFrame(
+        {
+            "arrow_text": pd.Series(["a", None, "c"], dtype="string[pyarrow]"),
+            "python_text": pd.Series(["a", "b", None], dtype="string[python]"),
+            "text": ["a", "b", "c"],
+            "label": pd.Series(["x", "y", "x"], dtype="category"),
+            "count": pd.Series([1, None, 3], dtype="Int8"),
+            "score": [0.5, 1.5, 2.5],
+        },
+        index=[10, 20, 30],
+    )
+    assert cache.put("key", dataframe)
+    cached: pd.DataFrame = cache.get("key")
+    pd.testing.assert_series_equal(cached.dtypes, dataframe.dtypes)
+    pd.testing.assert_frame_equal(cached, dataframe)
+
+
+def test_cache_put_on_unwritable_directory(tmp_path: Path) -> None:
+    blocker: Path = tmp_path / "file"
+    blocker.write_text("not a directory")
+    cache: PipelineCache = _cache(blocker / "cache")
+    assert not cache.put("key", pd.DataFrame({"a": [1]}))
+    assert cache.get("key") is None
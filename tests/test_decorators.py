@@ -0,0 +1,88 @@
+"""
+Tests for the decorators.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.config import settings
+from core.decorators import benchmark
+from core.metrics import metrics
+
+BUFFER_SIZE: int = 10_000_000
+
+
+@benchmark
+def _inner() -> int:
+    return len(bytes(BUFFER_SIZE // 10))
+
+
+@benchmark
+def _outer() -> int:
+    size: int = len(bytes(BUFFER_SIZE))
+    return size + _inner()
+
+
+def test_nested_benchmark_keeps_outer_peak_memory(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    monkeypatch.setattr(settings, "METRICS_TRACK_MEMORY", True)
+    metrics.reset()
+    _outer()
+    snapshot = metrics.snapshot()
+    outer_peak: float = snapshot[_outer.__qualname__]["peak_memory_bytes"][
+        "max"
+    ]
+    inner_peak: float = snapshot[_inner.__qualname__]["peak_memory_bytes"][
+        "max"
+    ]
+    assert outer_peak >= BUFFER_SIZE
+    assert BUFFER_SIZE // 10 <= inner_peak < BUFFER_SIZE
+
+
+def test_concurrent_benchmark_keeps_peak_memory(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    monkeypatch.setattr(settings, "METRICS_TRACK_MEMORY", True)
+    metrics.reset()
+    allocated: threading.Event = threading.Event()
+    measured: threading.Event = threading.Event()
+
+    @benchmark
+    def allocate() -> int:
+        size: int = len(bytes(BUFFER_SIZE))
+        allocated.set()
+        measured.wait(10)
+        return size
+
+    thread: threading.Thread = threading.Thread(target=allocate)
+    thread.start()
+    allocated.wait(10)
+    _inner()
+    measured.set()
+    thread.join()
+    snapshot = metrics.snapshot()
+    assert (
+        snapshot[allocate.__qualname__]["peak_memory_bytes"]["max"]
+        >= BUFFER_SIZE
+    )
+
+
+def _spin(seconds: float) -> None:
+    end: float = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_benchmark_cpu_time_includes_thread_pools(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    monkeypatch.setattr(settings, "METRICS_TRACK_CPU", True)
+    metrics.reset()
+
+    @benchmark
+    def run_pool() -> None:
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(_spin, 0.2).result()
+
+    run_pool()
+    assert (
+        metrics.snapshot()[run_pool.__qualname__]["cpu_seconds"]["max"] >= 0.1
+    )
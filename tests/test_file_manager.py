@@ -0,0 +1,100 @@
+"""
+Tests for the file managers.
+"""
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from docx import Document
+from docx.oxml import parse_xml
+from docx.shared import Inches
+
+from core.file_manager import DOCXManager
+
+W_NAMESPACE: str = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+)
+
+
+def _tab_stops(path: Path) -> None:
+    document = Document()
+    paragraph = document.add_paragraph("Hello world")
+    paragraph.paragraph_format.tab_stops.add_tab_stop(Inches(1))
+    paragraph.paragraph_format.tab_stops.add_tab_stop(Inches(2))
+    run = document.add_paragraph("Name").add_run()
+    run.add_tab()
+    run.add_text("Value")
+    run.add_break()
+    run.add_text("Next line")
+    document.save(path)
+
+
+def _content_controls(path: Path) -> None:
+    document = Document()
+    paragraph = document.add_paragraph("Before ")
+    paragraph._p.append(
+        parse_xml(
+            f"<w:sdt {W_NAMESPACE}><w:sdtPr/><w:sdtContent>"
+            "<w:r><w:t>inline control</w:t></w:r>"
+            "</w:sdtContent></w:sdt>"
+        )
+    )
+    paragraph.add_run(" after")
+    document.add_paragraph("Between")
+    document.element.body.insert(
+        -1,
+        parse_xml(
+            f"<w:sdt {W_NAMESPACE}><w:sdtPr/><w:sdtContent>"
+            "<w:p><w:r><w:t>block control</w:t></w:r></w:p>"
+            "</w:sdtContent></w:sdt>"
+        ),
+    )
+    document.add_table(rows=1, cols=2).cell(0, 0).text = "cell"
+    document.add_paragraph("Last")
+    document.save(path)
+
+
+@pytest.mark.parametrize("build", [_tab_stops, _content_controls])
+def test_docx_load_matches_python_docx(tmp_path: Path, build) -> None:
+    path: Path = tmp_path / "document.docx"
+    build(path)
+    expected: list[str] = [
+        paragraph.text for paragraph in Document(path).paragraphs
+    ]
+    loaded: list[str] = DOCXManager().load(path, None)[0].tolist()
+    assert loaded == expected
+    assert [
+        text
+        for chunk in DOCXManager().iter_load(path, None, chunk_size=2)
+        for text in chunk[0]
+    ] == expected
+
+
+def test_docx_save_writes_tab_separated_rows(tmp_path: Path) -> None:
+    path: Path = tmp_path / "rows.docx"
+    dataframe: pd.DataFrame = pd.DataFrame(
+        {"question": ["Reset <password>?", "Line\nbreak"], "answer": [1, None]}
+    )
+    assert DOCXManager().save(dataframe, None, str(path))
+    assert [paragraph.text for paragraph in Document(path).paragraphs] == [
+        "Reset <password>?\t1.0",
+        "Line\nbreak\t",
+    ]
+    assert [entry.name for entry in tmp_path.iterdir()] == ["rows.docx"]
+
+
+def test_docx_empty_save_keeps_existing_file(tmp_path: Path) -> None:
+    path: Path = tmp_path / "existing.docx"
+    _tab_stops(path)
+    content: bytes = path.read_bytes()
+    assert not DOCXManager().save(pd.DataFrame(), None, str(path))
+    assert not DOCXManager().iter_save(
+        iter([pd.DataFrame(), pd.DataFrame({"a": []})]), None, str(path)
+    )
+    assert path.read_bytes() == content
+    assert not DOCXManager().save(
+        pd.DataFrame(), None, str(tmp_path / "missing.docx")
+    )
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == [
+        "existing.docx"
+    ]
@@ -0,0 +1,46 @@
+"""
+Tests for the logging configuration.
+"""
+import io
+import json
+import logging
+from typing import Any
+
+from core.logging_config import (
+    JSONFormatter,
+    _setup_queue_handler,
+    _stop_queue_listener,
+)
+
+
+def _log_exception(queued: bool) -> dict[str, Any]:
+    stream: io.StringIO = io.StringIO()
+    handler: logging.StreamHandler = logging.StreamHandler(stream)
+    handler.setFormatter(JSONFormatter())
+    logger: logging.Logger = logging.getLogger(f"tests.queued.{queued}")
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.addHandler(handler)
+    if queued:
+        _setup_queue_handler(logger)
+    try:
+        raise ValueError("broken")
+    except ValueError:
+        logger.exception("Failed to process %s", "file.csv")
+    if queued:
+        _stop_queue_listener()
+    logger.handlers.clear()
+    entry: dict[str, Any] = json.loads(stream.getvalue())
+    entry.pop("timestamp")
+    entry.pop("thread")
+    entry.pop("name")
+    return entry
+
+
+def test_queue_mode_writes_the_same_json_as_direct_mode() -> None:
+    direct: dict[str, Any] = _log_exception(queued=False)
+    queued: dict[str, Any] = _log_exception(queued=True)
+    assert queued == direct
+    assert queued["message"] == "Failed to process file.csv"
+    assert "ValueError: broken" in queued["exception"]
@@ -0,0 +1,37 @@
+"""
+Tests for the dtype optimization.
+"""
+import io
+
+import pandas as pd
+
+from engineering.transformation.optimization import optimize_dtypes
+
+
+def test_optimize_dtypes_keeps_nullable_integers() -> None:
+    dataframe: pd.DataFrame = pd.read_csv(
+        io.StringIO("a,b\n1,300\n,70000\n3,\n"),
+        dtype_backend="numpy_nullable",
+    )
+    optimized: pd.DataFrame = optimize_dtypes(dataframe)
+    assert optimized.dtypes.astype(str).tolist() == ["Int8", "Int32"]
+    pd.testing.assert_frame_equal(
+        optimized, dataframe, check_dtype=False, check_exact=True
+    )
+
+
+def test_optimize_dtypes_keeps_signed_integers_signed() -> None:
+    dataframe: pd.DataFrame = pd.DataFrame(
+        {
+            "signed": pd.Series([0, 1, 200], dtype="int64"),
+            "unsigned": pd.Series([0, 1, 200], dtype="uint64"),
+            "arrow": pd.Series([0, 1, None], dtype="int64[pyarrow]"),
+        }
+    )
+    optimized: pd.DataFrame = optimize_dtypes(dataframe)
+    assert optimized.dtypes.astype(str).tolist() == [
+        "int16",
+        "uint8",
+        "int8[pyarrow]",
+    ]
+    assert (optimized["signed"] - 1).min() == -1
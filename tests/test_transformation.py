@@ -0,0 +1,18 @@
+"""
+Tests for the transformation pipeline.
+"""
+import pandas as pd
+
+from engineering.transformation.transformation import transform_data
+
+
+def test_transform_data_leaves_input_unchanged() -> None:
+    dataframe: pd.DataFrame = pd.DataFrame(
+        {"existing_feature": [1, 2, 3], "other": [4.0, 5.0, 6.0]}
+    )
+    expected: pd.DataFrame = dataframe.copy()
+    for stages in (None, [], ["clean_data"], ["engineer_features"]):
+        transformed: pd.DataFrame = transform_data(dataframe, stages)
+        transformed.iloc[0, 0] = 999
+        transformed.iloc[1, 1] = -1.0
+        pd.testing.assert_frame_equal(dataframe, expected)
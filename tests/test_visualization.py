@@ -0,0 +1,26 @@
+"""
+Tests for the visualization functions.
+"""
+import os
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+import pandas as pd
+
+from analysis.visualization import plot_count
+from core.config import settings
+
+matplotlib.use("Agg")
+
+
+def test_plot_count_with_integer_column_labels(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings, "HEADLESS_PLOTS", True)
+    dataframe: pd.DataFrame = pd.DataFrame(
+        np.random.default_rng(0).integers(0, 3, size=(50, 3))
+    )
+    plot_count(dataframe, [0, 1], 2)
+    assert os.listdir(tmp_path / "reports" / "figures") == ["discrete_0_1.png"]